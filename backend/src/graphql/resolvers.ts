@@ -79,6 +79,25 @@ async function checkPortfolioAccess(
   return portfolio;
 }
 
+// Float view of an investment's Decimal columns. Number(Decimal) goes through
+// a string round-trip, so each row is converted once and reused by the
+// aggregate and per-field resolvers; Decimal stays the value that is serialized.
+interface InvestmentFloats {
+  quantity: number;
+  purchasePrice: number;
+}
+
+const investmentFloatCache = new WeakMap<object, InvestmentFloats>();
+
+function investmentFloats(inv: { quantity: unknown; purchasePrice: unknown }): InvestmentFloats {
+  let floats = investmentFloatCache.get(inv);
+  if (!floats) {
+    floats = { quantity: Number(inv.quantity), purchasePrice: Number(inv.purchasePrice) };
+    investmentFloatCache.set(inv, floats);
+  }
+  return floats;
+}
+
 // Scalar resolvers
 const dateTimeScalar = {
   serialize(value: Date): string {
@@ -399,12 +418,15 @@ export const resolvers = {
       const annualReturn = 0.07;
       const volatility = 0.15;
 
+      // Loop invariants of the yearly growth factor
+      const drift = 1 + annualReturn - volatility;
+      const shockScale = volatility * 2;
+
       const results: number[] = [];
       for (let s = 0; s < simulations; s++) {
         let value = startValue;
         for (let y = 0; y < years; y++) {
-          const randomReturn = annualReturn + volatility * (Math.random() * 2 - 1);
-          value *= 1 + randomReturn;
+          value *= drift + shockScale * Math.random();
         }
         results.push(value);
       }
@@ -438,20 +460,24 @@ export const resolvers = {
         where: { portfolioId: portfolio.id },
       });
 
-      const totalValue = investments.reduce((sum, inv) => {
-        return sum + Number(inv.quantity) * Number(inv.purchasePrice);
-      }, 0);
+      // Index holdings by symbol once instead of scanning per target
+      const bySymbol = new Map<string, (typeof investments)[number]>();
+      let totalValue = 0;
+      for (const inv of investments) {
+        if (!bySymbol.has(inv.symbol)) bySymbol.set(inv.symbol, inv);
+        const { quantity, purchasePrice } = investmentFloats(inv);
+        totalValue += quantity * purchasePrice;
+      }
 
       return args.input.targetAllocations.map((target: any) => {
-        const investment = investments.find((i) => i.symbol === target.symbol);
-        const currentValue = investment
-          ? Number(investment.quantity) * Number(investment.purchasePrice)
-          : 0;
+        const investment = bySymbol.get(target.symbol);
+        const floats = investment ? investmentFloats(investment) : undefined;
+        const currentValue = floats ? floats.quantity * floats.purchasePrice : 0;
         const currentPercent = totalValue > 0 ? (currentValue / totalValue) * 100 : 0;
         const targetValue = (totalValue * target.targetPercent) / 100;
-        const currentPrice = investment ? Number(investment.purchasePrice) : 100;
+        const currentPrice = floats ? floats.purchasePrice : 100;
         const suggestedShares = targetValue / currentPrice;
-        const currentShares = investment ? Number(investment.quantity) : 0;
+        const currentShares = floats ? floats.quantity : 0;
 
         return {
           symbol: target.symbol,
@@ -732,10 +758,12 @@ export const resolvers = {
       const investments = await prisma.investment.findMany({
         where: { portfolioId: parent.id },
       });
-      return investments.reduce(
-        (sum, inv) => sum + Number(inv.quantity) * Number(inv.purchasePrice) * 1.1,
-        0
-      );
+      let totalValue = 0;
+      for (const inv of investments) {
+        const { quantity, purchasePrice } = investmentFloats(inv);
+        totalValue += quantity * purchasePrice;
+      }
+      return totalValue * 1.1;
     },
     totalGain: () => 15000, // Would calculate from market data
     totalGainPercent: () => 12.5,
@@ -767,10 +795,15 @@ export const resolvers = {
       });
     },
     currentPrice: () => 155.5,
-    currentValue: (parent: any) => Number(parent.quantity) * 155.5,
-    gain: (parent: any) => Number(parent.quantity) * (155.5 - Number(parent.purchasePrice)),
-    gainPercent: (parent: any) =>
-      ((155.5 - Number(parent.purchasePrice)) / Number(parent.purchasePrice)) * 100,
+    currentValue: (parent: any) => investmentFloats(parent).quantity * 155.5,
+    gain: (parent: any) => {
+      const { quantity, purchasePrice } = investmentFloats(parent);
+      return quantity * (155.5 - purchasePrice);
+    },
+    gainPercent: (parent: any) => {
+      const { purchasePrice } = investmentFloats(parent);
+      return ((155.5 - purchasePrice) / purchasePrice) * 100;
+    },
     dayChange: () => 2.5,
     dayChangePercent: () => 1.6,
     weight: () => 15,
@@ -0,0 +1,55 @@
+import { describe, expect, it } from 'vitest';
+
+import { AdaptiveConcurrencyLimiter } from './concurrencyLimiter.js';
+
+function deferred() {
+  let resolve!: () => void;
+  const promise = new Promise<void>((r) => (resolve = r));
+  return { promise, resolve };
+}
+
+describe('AdaptiveConcurrencyLimiter', () => {
+  it('never runs more tasks than the current limit', async () => {
+    const limiter = new AdaptiveConcurrencyLimiter(2);
+    const gates = [deferred(), deferred(), deferred()];
+    let running = 0;
+    let peak = 0;
+
+    const tasks = gates.map((gate) =>
+      limiter.run(async () => {
+        running++;
+        peak = Math.max(peak, running);
+        await gate.promise;
+        running--;
+      })
+    );
+
+    await Promise.resolve();
+    expect(running).toBe(2);
+    expect(limiter.pending).toBe(1);
+
+    gates.forEach((gate) => gate.resolve());
+    await Promise.all(tasks);
+
+    expect(peak).toBe(2);
+    expect(limiter.pending).toBe(0);
+  });
+
+  it('halves on overload and recovers additively', () => {
+    const limiter = new AdaptiveConcurrencyLimiter(8);
+
+    limiter.recordOverload();
+    expect(limiter.concurrency).toBe(4);
+    limiter.recordOverload();
+    limiter.recordOverload();
+    limiter.recordOverload();
+    expect(limiter.concurrency).toBe(1);
+
+    limiter.recordSuccess();
+    limiter.recordSuccess();
+    expect(limiter.concurrency).toBe(2);
+
+    for (let i = 0; i < 100; i++) limiter.recordSuccess();
+    expect(limiter.concurrency).toBe(8);
+  });
+});
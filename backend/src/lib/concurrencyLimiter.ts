@@ -0,0 +1,70 @@
+/**
+ * Adaptive concurrency limiter (AIMD)
+ *
+ * Caps the number of in-flight tasks. The cap grows additively after each
+ * success and is halved when the upstream signals overload (HTTP 429/5xx),
+ * so bursts back off quickly and recover gradually.
+ */
+export class AdaptiveConcurrencyLimiter {
+  private limit: number;
+  private active = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(
+    private readonly maxConcurrency = 8,
+    private readonly minConcurrency = 1,
+    private readonly increaseStep = 0.5,
+    private readonly decreaseFactor = 0.5
+  ) {
+    this.limit = maxConcurrency;
+  }
+
+  /** Current number of tasks allowed in flight */
+  get concurrency(): number {
+    return Math.floor(this.limit);
+  }
+
+  get pending(): number {
+    return this.waiters.length;
+  }
+
+  async run<T>(task: () => Promise<T>): Promise<T> {
+    await this.acquire();
+    try {
+      return await task();
+    } finally {
+      this.release();
+    }
+  }
+
+  /** Additive increase after a successful call */
+  recordSuccess(): void {
+    this.limit = Math.min(this.maxConcurrency, this.limit + this.increaseStep);
+    this.drain();
+  }
+
+  /** Multiplicative decrease after the upstream throttles or fails */
+  recordOverload(): void {
+    this.limit = Math.max(this.minConcurrency, this.limit * this.decreaseFactor);
+  }
+
+  private acquire(): Promise<void> {
+    if (this.active < this.concurrency) {
+      this.active++;
+      return Promise.resolve();
+    }
+    return new Promise((resolve) => this.waiters.push(resolve));
+  }
+
+  private release(): void {
+    this.active--;
+    this.drain();
+  }
+
+  private drain(): void {
+    while (this.waiters.length > 0 && this.active < this.concurrency) {
+      this.active++;
+      this.waiters.shift()!();
+    }
+  }
+}
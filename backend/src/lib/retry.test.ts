@@ -0,0 +1,63 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import { TransientError, retryTransient } from './retry.js';
+
+const fast = { baseDelayMs: 0, jitterMs: 0 };
+
+function fetchFailed(code: string) {
+  return new TypeError('fetch failed', { cause: Object.assign(new Error(code), { code }) });
+}
+
+describe('retryTransient', () => {
+  it('retries transient failures until one succeeds', async () => {
+    const fn = vi
+      .fn()
+      .mockImplementationOnce(() => Promise.reject(new TransientError('503')))
+      .mockImplementationOnce(() => Promise.reject(fetchFailed('ECONNRESET')))
+      .mockImplementationOnce(() => Promise.resolve('ok'));
+
+    expect(await retryTransient(fn, fast)).toBe('ok');
+    expect(fn).toHaveBeenCalledTimes(3);
+  });
+
+  it('gives up after the attempt budget', async () => {
+    const fn = vi.fn(() => Promise.reject(new TransientError('502')));
+
+    await expect(retryTransient(fn, { ...fast, attempts: 2 })).rejects.toThrow();
+    expect(fn).toHaveBeenCalledTimes(2);
+  });
+
+  it('does not retry non-transient errors', async () => {
+    const fn = vi.fn(() => Promise.reject(new Error('API error: 404')));
+
+    await expect(retryTransient(fn, fast)).rejects.toThrow();
+    expect(fn).toHaveBeenCalledTimes(1);
+  });
+
+  it('does not retry TypeErrors that are not network failures', async () => {
+    const fn = vi.fn(() =>
+      Promise.reject(new TypeError("Cannot read properties of undefined (reading 'price')"))
+    );
+
+    await expect(retryTransient(fn, fast)).rejects.toThrow();
+    expect(fn).toHaveBeenCalledTimes(1);
+  });
+
+  it('retries undici socket errors and request timeouts', async () => {
+    const fn = vi
+      .fn()
+      .mockImplementationOnce(() => Promise.reject(fetchFailed('UND_ERR_SOCKET')))
+      .mockImplementationOnce(() => Promise.reject(new DOMException('timed out', 'TimeoutError')))
+      .mockImplementationOnce(() => Promise.resolve('ok'));
+
+    expect(await retryTransient(fn, fast)).toBe('ok');
+    expect(fn).toHaveBeenCalledTimes(3);
+  });
+
+  it('does not wait out a Retry-After beyond the max delay', async () => {
+    const fn = vi.fn(() => Promise.reject(new TransientError('429', 60_000)));
+
+    await expect(retryTransient(fn, { ...fast, maxDelayMs: 1_000 })).rejects.toThrow();
+    expect(fn).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,70 @@
+/**
+ * Retry with exponential backoff
+ *
+ * Re-runs an async call on transient failures (connection-level fetch
+ * failures, request timeouts and TransientError, e.g. HTTP 429/5xx) with
+ * jittered exponential delays. Anything else, including programming errors
+ * thrown inside the call, is rethrown straight away.
+ */
+
+export class TransientError extends Error {
+  constructor(
+    message: string,
+    public readonly retryAfterMs?: number
+  ) {
+    super(message);
+    this.name = 'TransientError';
+  }
+}
+
+export interface RetryOptions {
+  attempts?: number;
+  baseDelayMs?: number;
+  maxDelayMs?: number;
+  jitterMs?: number;
+}
+
+// Socket/DNS error codes worth retrying; undici's own are prefixed UND_ERR_
+const TRANSIENT_NETWORK_CODES = new Set([
+  'ECONNRESET',
+  'ECONNREFUSED',
+  'ENOTFOUND',
+  'ETIMEDOUT',
+  'EAI_AGAIN',
+  'EPIPE',
+]);
+
+/** fetch() rejects with TypeError('fetch failed') whose cause is the network error */
+function isNetworkFailure(error: unknown): boolean {
+  if (!(error instanceof TypeError) || error.message !== 'fetch failed') return false;
+  const code = (error.cause as { code?: unknown } | undefined)?.code;
+  return typeof code === 'string' && (TRANSIENT_NETWORK_CODES.has(code) || code.startsWith('UND_ERR_'));
+}
+
+function isTransient(error: unknown): boolean {
+  if (error instanceof TransientError) return true;
+  if (isNetworkFailure(error)) return true;
+  // AbortSignal.timeout() rejects with a DOMException named TimeoutError
+  return error instanceof Error && error.name === 'TimeoutError';
+}
+
+export async function retryTransient<T>(
+  fn: () => Promise<T>,
+  { attempts = 3, baseDelayMs = 1_000, maxDelayMs = 30_000, jitterMs = 1_000 }: RetryOptions = {}
+): Promise<T> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      if (attempt + 1 >= attempts || !isTransient(error)) throw error;
+
+      const retryAfterMs = error instanceof TransientError ? error.retryAfterMs : undefined;
+      // A server asking us to wait longer than we're willing to is a hard failure
+      if (retryAfterMs !== undefined && retryAfterMs > maxDelayMs) throw error;
+
+      const delayMs =
+        retryAfterMs ?? Math.min(maxDelayMs, baseDelayMs * 2 ** attempt) + Math.random() * jitterMs;
+      await new Promise((resolve) => setTimeout(resolve, delayMs));
+    }
+  }
+}
@@ -0,0 +1,82 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { TransientError, retryTransient } from './retry.js';
+import { SlidingWindowLimiter, parseRetryAfter } from './slidingWindowLimiter.js';
+
+describe('SlidingWindowLimiter', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('rejects once the window budget is spent', async () => {
+    const limiter = new SlidingWindowLimiter(2, 60_000, 0);
+    await limiter.acquire();
+    await limiter.acquire();
+
+    await expect(limiter.acquire()).rejects.toThrow();
+
+    vi.advanceTimersByTime(60_000);
+    await limiter.acquire();
+  });
+
+  it('pauses for Retry-After on 429', async () => {
+    const limiter = new SlidingWindowLimiter(100, 60_000, 0);
+    limiter.observe(429, new Headers({ 'Retry-After': '5' }));
+
+    await expect(limiter.acquire()).rejects.toThrow();
+
+    vi.advanceTimersByTime(5_000);
+    await limiter.acquire();
+  });
+
+  it('backs off when the advertised quota is nearly exhausted', async () => {
+    const limiter = new SlidingWindowLimiter(100, 60_000, 0);
+    limiter.observe(200, new Headers({ 'X-RateLimit-Remaining': '50', 'X-RateLimit-Limit': '100' }));
+    await limiter.acquire();
+
+    limiter.observe(200, new Headers({ 'X-RateLimit-Remaining': '5', 'X-RateLimit-Limit': '100' }));
+    await expect(limiter.acquire()).rejects.toThrow();
+  });
+
+  it('does not pause on responses without rate-limit headers', async () => {
+    const limiter = new SlidingWindowLimiter(100, 60_000, 0);
+    limiter.observe(200, new Headers());
+
+    await limiter.acquire();
+  });
+});
+
+describe('SlidingWindowLimiter with retryTransient', () => {
+  it('retries a 429 that carries no Retry-After', async () => {
+    const limiter = new SlidingWindowLimiter(100, 60_000, 20);
+    let calls = 0;
+
+    const result = await retryTransient(
+      async () => {
+        await limiter.acquire();
+        calls++;
+        if (calls === 1) {
+          limiter.observe(429, new Headers());
+          throw new TransientError('429');
+        }
+        return 'ok';
+      },
+      { baseDelayMs: 0, jitterMs: 0 }
+    );
+
+    expect(result).toBe('ok');
+    expect(calls).toBe(2);
+  });
+});
+
+describe('parseRetryAfter', () => {
+  it('accepts delta-seconds and ignores garbage', () => {
+    expect(parseRetryAfter('2')).toBe(2_000);
+    expect(parseRetryAfter(null)).toBeUndefined();
+    expect(parseRetryAfter('soon')).toBeUndefined();
+  });
+});
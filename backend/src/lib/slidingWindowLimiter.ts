@@ -0,0 +1,98 @@
+/**
+ * Sliding-window request limiter
+ *
+ * Tracks request timestamps over the last window and delays callers once the
+ * budget is spent, so we throttle ourselves before an upstream API does.
+ * Rate-limit response headers can shrink the budget further (or pause it
+ * entirely on 429).
+ */
+export class SlidingWindowLimiter {
+  private timestamps: number[] = [];
+  private pausedUntil = 0;
+
+  constructor(
+    private readonly requestsPerWindow: number,
+    private readonly windowMs = 60_000,
+    private readonly maxWaitMs = 5_000
+  ) {}
+
+  /**
+   * Wait for a free slot in the window. Throws if that would take longer than
+   * `maxWaitMs`, letting the caller fall back instead of stalling.
+   */
+  async acquire(): Promise<void> {
+    for (;;) {
+      const now = Date.now();
+      while (this.timestamps.length > 0 && this.timestamps[0] <= now - this.windowMs) {
+        this.timestamps.shift();
+      }
+
+      let waitMs = this.pausedUntil - now;
+      if (this.timestamps.length >= this.requestsPerWindow) {
+        waitMs = Math.max(waitMs, this.timestamps[0] + this.windowMs - now);
+      }
+
+      if (waitMs <= 0) {
+        this.timestamps.push(now);
+        return;
+      }
+      if (waitMs > this.maxWaitMs) {
+        throw new Error(`Rate limit reached, retry in ${Math.ceil(waitMs / 1000)}s`);
+      }
+
+      await new Promise((resolve) => setTimeout(resolve, waitMs));
+    }
+  }
+
+  /** Block new requests for `ms` milliseconds */
+  pause(ms: number): void {
+    this.pausedUntil = Math.max(this.pausedUntil, Date.now() + ms);
+  }
+
+  /**
+   * Adapt to upstream rate-limit headers: honor Retry-After on 429 and back
+   * off for one slot when less than 10% of the advertised quota remains.
+   * A 429 without Retry-After pauses for at most `maxWaitMs`, so the caller's
+   * retry can still acquire a slot instead of being rejected outright.
+   */
+  observe(status: number, headers: Headers): void {
+    const retryAfterMs = parseRetryAfter(headers.get('retry-after'));
+
+    if (status === 429) {
+      this.pause(retryAfterMs ?? Math.min(this.windowMs, this.maxWaitMs));
+      return;
+    }
+
+    // Providers that don't advertise a quota (e.g. Alpha Vantage) send no
+    // headers at all; Number(null) would read that as 0 remaining
+    const remainingHeader =
+      headers.get('x-ratelimit-remaining') ?? headers.get('x-factset-api-requests-remaining');
+    if (remainingHeader === null) return;
+
+    const remaining = Number(remainingHeader);
+    const limit = Number(
+      headers.get('x-ratelimit-limit') ??
+        headers.get('x-factset-api-requests-limit') ??
+        this.requestsPerWindow
+    );
+
+    if (Number.isFinite(remaining) && limit > 0 && remaining / limit < 0.1) {
+      this.pause(retryAfterMs ?? this.windowMs / limit);
+    }
+  }
+}
+
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP date) into milliseconds
+ */
+export function parseRetryAfter(value: string | null): number | undefined {
+  if (!value) return undefined;
+
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
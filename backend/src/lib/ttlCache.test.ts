@@ -0,0 +1,46 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { TTLCache } from './ttlCache.js';
+
+describe('TTLCache', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('returns values until their TTL elapses', () => {
+    const cache = new TTLCache<number>();
+    cache.set('a', 1, 60);
+
+    vi.advanceTimersByTime(59_000);
+    expect(cache.get('a')).toBe(1);
+
+    vi.advanceTimersByTime(1_000);
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  it('evicts the oldest entry when full', () => {
+    const cache = new TTLCache<string>(2);
+    cache.set('a', 'A', 60);
+    cache.set('b', 'B', 60);
+    cache.set('c', 'C', 60);
+
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.get('b')).toBe('B');
+    expect(cache.get('c')).toBe('C');
+  });
+
+  it('overwrites existing keys without evicting others', () => {
+    const cache = new TTLCache<string>(2);
+    cache.set('a', 'A', 60);
+    cache.set('b', 'B', 60);
+    cache.set('a', 'A2', 60);
+
+    expect(cache.get('a')).toBe('A2');
+    expect(cache.get('b')).toBe('B');
+  });
+});
@@ -0,0 +1,43 @@
+/**
+ * In-process TTL cache
+ *
+ * Holds values in memory with a per-entry expiry. Entries are evicted lazily
+ * on read, and the oldest entry is dropped once `maxEntries` is reached.
+ */
+export class TTLCache<T> {
+  private entries = new Map<string, { value: T; expiresAt: number }>();
+
+  constructor(private readonly maxEntries = 1000) {}
+
+  get(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+
+    return entry.value;
+  }
+
+  set(key: string, value: T, ttlSeconds: number): void {
+    if (!this.entries.has(key) && this.entries.size >= this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value!);
+    }
+
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlSeconds * 1000 });
+  }
+
+  delete(key: string): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
@@ -13,6 +13,11 @@ const rebalanceSchema = z.object({
   targetAllocation: z.record(z.number().min(0).max(100)).optional(),
 });
 
+const scenarioSchema = z.object({
+  scenarios: z.number().int().min(1).max(10_000).default(1000),
+  horizon: z.number().int().min(1).max(2520).default(252), // up to 10 years of trading days
+});
+
 export async function analyticsRoutes(app: FastifyInstance) {
   // All routes require authentication
   app.addHook('preHandler', app.authenticate);
@@ -28,12 +33,13 @@ export async function analyticsRoutes(app: FastifyInstance) {
       const { id: portfolioId } = portfolioIdSchema.parse(request.params);
 
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
+      const positions = toPositions(portfolio.investments);
 
       // Calculate all analytics
-      const stats = calculatePortfolioStats(portfolio.investments);
-      const allocation = calculateAllocation(portfolio.investments);
-      const performance = calculatePerformance(portfolio.investments);
-      const risk = calculateRiskMetrics(portfolio.investments);
+      const stats = calculatePortfolioStats(positions);
+      const allocation = calculateAllocation(positions);
+      const performance = calculatePerformance(positions);
+      const risk = calculateRiskMetrics(positions);
 
       return reply.send({
         success: true,
@@ -59,7 +65,7 @@ export async function analyticsRoutes(app: FastifyInstance) {
 
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
 
-      const risk = calculateDetailedRisk(portfolio.investments);
+      const risk = calculateDetailedRisk(toPositions(portfolio.investments));
 
       return reply.send({
         success: true,
@@ -82,7 +88,7 @@ export async function analyticsRoutes(app: FastifyInstance) {
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
 
       const recommendations = calculateRebalanceRecommendations(
-        portfolio.investments,
+        toPositions(portfolio.investments),
         targetAllocation
       );
 
@@ -105,7 +111,7 @@ export async function analyticsRoutes(app: FastifyInstance) {
 
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
 
-      const taxAnalysis = calculateTaxImpact(portfolio.investments);
+      const taxAnalysis = calculateTaxImpact(toPositions(portfolio.investments));
 
       return reply.send({
         success: true,
@@ -126,7 +132,7 @@ export async function analyticsRoutes(app: FastifyInstance) {
 
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
 
-      const correlation = calculateCorrelationMatrix(portfolio.investments);
+      const correlation = calculateCorrelationMatrix(toPositions(portfolio.investments));
 
       return reply.send({
         success: true,
@@ -150,11 +156,15 @@ export async function analyticsRoutes(app: FastifyInstance) {
     ) => {
       const userId = request.user.id;
       const { id: portfolioId } = portfolioIdSchema.parse(request.params);
-      const { scenarios = 1000, horizon = 252 } = request.body || {};
+      const { scenarios, horizon } = scenarioSchema.parse(request.body ?? {});
 
       const portfolio = await getPortfolioWithAccess(portfolioId, userId);
 
-      const simulation = runMonteCarloSimulation(portfolio.investments, scenarios, horizon);
+      const simulation = runMonteCarloSimulation(
+        toPositions(portfolio.investments),
+        scenarios,
+        horizon
+      );
 
       return reply.send({
         success: true,
@@ -193,6 +203,25 @@ async function getPortfolioWithAccess(portfolioId: string, userId: string) {
   return portfolio;
 }
 
+// Mock current prices (in production, fetch real prices)
+const MOCK_CURRENT_PRICES: Readonly<Record<string, number>> = Object.freeze({
+  AAPL: 175.5,
+  MSFT: 295.25,
+  GOOGL: 142.3,
+  AMZN: 151.8,
+  TSLA: 242.5,
+  VOO: 425.75,
+  SPY: 458.2,
+});
+
+// Default balanced allocation
+const DEFAULT_TARGET_ALLOCATION: Readonly<Record<string, number>> = Object.freeze({
+  STOCK: 50,
+  ETF: 30,
+  BOND: 15,
+  CRYPTO: 5,
+});
+
 interface InvestmentData {
   symbol: string;
   name: string;
@@ -203,7 +232,170 @@ interface InvestmentData {
   sector?: string | null;
 }
 
-function calculatePortfolioStats(investments: InvestmentData[]) {
+/**
+ * Holding with numeric fields as plain numbers. Decimal stays the storage
+ * type; analytics convert once here instead of in every helper loop.
+ */
+interface Position {
+  symbol: string;
+  name: string;
+  type: string;
+  quantity: number;
+  purchasePrice: number;
+  purchaseDate: Date;
+  sector?: string | null;
+}
+
+function toPositions(investments: InvestmentData[]): Position[] {
+  return investments.map((inv) => ({
+    symbol: inv.symbol,
+    name: inv.name,
+    type: inv.type,
+    quantity: inv.quantity.toNumber(),
+    purchasePrice: inv.purchasePrice.toNumber(),
+    purchaseDate: inv.purchaseDate,
+    sector: inv.sector,
+  }));
+}
+
+/**
+ * Parallel numeric columns over a position list, built lazily once per list
+ * (lists are never mutated) so value reductions run over contiguous arrays.
+ */
+interface PositionColumns {
+  quantity: Float64Array;
+  purchasePrice: Float64Array;
+  costBasis: Float64Array; // quantity * purchasePrice
+  totalCost: number;
+  purchaseTime: Float64Array; // epoch ms
+}
+
+const positionColumns = new WeakMap<Position[], PositionColumns>();
+
+function getPositionColumns(positions: Position[]): PositionColumns {
+  let columns = positionColumns.get(positions);
+  if (!columns) {
+    const n = positions.length;
+    columns = {
+      quantity: new Float64Array(n),
+      purchasePrice: new Float64Array(n),
+      costBasis: new Float64Array(n),
+      totalCost: 0,
+      purchaseTime: new Float64Array(n),
+    };
+    for (let i = 0; i < n; i++) {
+      const { quantity, purchasePrice, purchaseDate } = positions[i];
+      columns.quantity[i] = quantity;
+      columns.purchasePrice[i] = purchasePrice;
+      columns.purchaseTime[i] = purchaseDate.getTime();
+      columns.costBasis[i] = quantity * purchasePrice;
+      columns.totalCost += columns.costBasis[i];
+    }
+    positionColumns.set(positions, columns);
+  }
+  return columns;
+}
+
+// Crypto and small caps have higher liquidity risk
+const HIGH_LIQUIDITY_RISK_TYPES = new Set(['CRYPTO', 'OTHER']);
+
+/**
+ * Distinct types/sectors (in first-seen order) with each position's index
+ * into them, plus liquidity buckets, classified in one pass per list
+ */
+interface PositionClasses {
+  types: string[];
+  typeIndex: Int32Array;
+  sectors: string[];
+  sectorIndex: Int32Array; // -1 when the position has no sector
+  highLiquidityRiskCount: number;
+}
+
+const positionClasses = new WeakMap<Position[], PositionClasses>();
+
+function internKey(ids: Map<string, number>, keys: string[], key: string): number {
+  let id = ids.get(key);
+  if (id === undefined) {
+    id = keys.push(key) - 1;
+    ids.set(key, id);
+  }
+  return id;
+}
+
+function classifyPositions(positions: Position[]): PositionClasses {
+  let classes = positionClasses.get(positions);
+  if (!classes) {
+    const n = positions.length;
+    const typeIds = new Map<string, number>();
+    const sectorIds = new Map<string, number>();
+    classes = {
+      types: [],
+      typeIndex: new Int32Array(n),
+      sectors: [],
+      sectorIndex: new Int32Array(n),
+      highLiquidityRiskCount: 0,
+    };
+    for (let i = 0; i < n; i++) {
+      const inv = positions[i];
+      classes.typeIndex[i] = internKey(typeIds, classes.types, inv.type);
+      classes.sectorIndex[i] = inv.sector ? internKey(sectorIds, classes.sectors, inv.sector) : -1;
+      if (HIGH_LIQUIDITY_RISK_TYPES.has(inv.type)) classes.highLiquidityRiskCount++;
+    }
+    positionClasses.set(positions, classes);
+  }
+  return classes;
+}
+
+/** Sum per-position values into buckets by class index (negative indexes are skipped) */
+function sumByClass(index: Int32Array, classCount: number, values: Float64Array): Float64Array {
+  const totals = new Float64Array(classCount);
+  for (let i = 0; i < index.length; i++) {
+    if (index[i] >= 0) totals[index[i]] += values[i];
+  }
+  return totals;
+}
+
+/** Current price per position from a price table, falling back to cost */
+function markPrices(positions: Position[], prices: Readonly<Record<string, number>>): Float64Array {
+  const { purchasePrice } = getPositionColumns(positions);
+  const marks = new Float64Array(positions.length);
+  for (let i = 0; i < positions.length; i++) {
+    marks[i] = prices[positions[i].symbol] || purchasePrice[i];
+  }
+  return marks;
+}
+
+/** Per-position market value and the portfolio total, in one pass */
+function marketValues(positions: Position[], prices: Readonly<Record<string, number>>) {
+  const { quantity, purchasePrice } = getPositionColumns(positions);
+  const values = new Float64Array(positions.length);
+  let total = 0;
+  for (let i = 0; i < positions.length; i++) {
+    const value = quantity[i] * (prices[positions[i].symbol] || purchasePrice[i]);
+    values[i] = value;
+    total += value;
+  }
+  return { values, total };
+}
+
+const MS_PER_DAY = 1000 * 60 * 60 * 24;
+
+/** Whole days from each timestamp to `asOf`, over the whole column at once */
+function daysSince(times: Float64Array, asOf: number): Int32Array {
+  const days = new Int32Array(times.length);
+  for (let i = 0; i < times.length; i++) {
+    days[i] = Math.floor((asOf - times[i]) / MS_PER_DAY);
+  }
+  return days;
+}
+
+function dot(a: Float64Array, b: Float64Array): number {
+  let sum = 0;
+  for (let i = 0; i < a.length; i++) sum += a[i] * b[i];
+  return sum;
+}
+
+function calculatePortfolioStats(investments: Position[]) {
   if (investments.length === 0) {
     return {
       totalValue: 0,
@@ -215,42 +407,24 @@ function calculatePortfolioStats(investments: InvestmentData[]) {
     };
   }
 
-  // Use mock current prices (in production, fetch real prices)
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    AMZN: 151.8,
-    TSLA: 242.5,
-    VOO: 425.75,
-    SPY: 458.2,
-  };
-
-  let totalValue = 0;
-  let totalInvested = 0;
-  const returns: number[] = [];
-
-  for (const inv of investments) {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
+  const { quantity, purchasePrice, totalCost: totalInvested } = getPositionColumns(investments);
+  const currentPrice = markPrices(investments, MOCK_CURRENT_PRICES);
 
-    const invested = quantity * purchasePrice;
-    const value = quantity * currentPrice;
-    const returnPct = ((currentPrice - purchasePrice) / purchasePrice) * 100;
+  const totalValue = dot(quantity, currentPrice);
 
-    totalInvested += invested;
-    totalValue += value;
-    returns.push(returnPct);
+  let returnSum = 0;
+  for (let i = 0; i < investments.length; i++) {
+    returnSum += ((currentPrice[i] - purchasePrice[i]) / purchasePrice[i]) * 100;
   }
 
   const totalGainLoss = totalValue - totalInvested;
   const gainLossPercentage = totalInvested > 0 ? (totalGainLoss / totalInvested) * 100 : 0;
-  const averageReturn = returns.length > 0 ? returns.reduce((a, b) => a + b, 0) / returns.length : 0;
+  const averageReturn = returnSum / investments.length;
 
   // Simple diversification score based on number of holdings and types
-  const uniqueTypes = new Set(investments.map((i) => i.type)).size;
-  const uniqueSectors = new Set(investments.filter((i) => i.sector).map((i) => i.sector)).size;
+  const { types, sectors } = classifyPositions(investments);
+  const uniqueTypes = types.length;
+  const uniqueSectors = sectors.length;
   const diversificationScore = Math.min(
     100,
     investments.length * 10 + uniqueTypes * 15 + uniqueSectors * 10
@@ -266,43 +440,28 @@ function calculatePortfolioStats(investments: InvestmentData[]) {
   };
 }
 
-function calculateAllocation(investments: InvestmentData[]) {
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    AMZN: 151.8,
-    TSLA: 242.5,
-    VOO: 425.75,
-    SPY: 458.2,
-  };
-
+function calculateAllocation(investments: Position[]) {
   const byType: Record<string, number> = {};
   const bySector: Record<string, number> = {};
-  const byAsset: Array<{ symbol: string; name: string; value: number; percentage: number }> = [];
 
-  let totalValue = 0;
+  const { values, total: totalValue } = marketValues(investments, MOCK_CURRENT_PRICES);
+  const { types, typeIndex, sectors, sectorIndex } = classifyPositions(investments);
 
-  for (const inv of investments) {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
-    const value = quantity * currentPrice;
-
-    totalValue += value;
-    byType[inv.type] = (byType[inv.type] || 0) + value;
-    if (inv.sector) {
-      bySector[inv.sector] = (bySector[inv.sector] || 0) + value;
-    }
-    byAsset.push({ symbol: inv.symbol, name: inv.name, value, percentage: 0 });
-  }
+  const typeTotals = sumByClass(typeIndex, types.length, values);
+  const sectorTotals = sumByClass(sectorIndex, sectors.length, values);
+  const byAsset = investments.map((inv, i) => ({
+    symbol: inv.symbol,
+    name: inv.name,
+    value: values[i],
+    percentage: 0,
+  }));
 
   // Calculate percentages
-  for (const key of Object.keys(byType)) {
-    byType[key] = parseFloat(((byType[key] / totalValue) * 100).toFixed(2));
+  for (let t = 0; t < types.length; t++) {
+    byType[types[t]] = parseFloat(((typeTotals[t] / totalValue) * 100).toFixed(2));
   }
-  for (const key of Object.keys(bySector)) {
-    bySector[key] = parseFloat(((bySector[key] / totalValue) * 100).toFixed(2));
+  for (let s = 0; s < sectors.length; s++) {
+    bySector[sectors[s]] = parseFloat(((sectorTotals[s] / totalValue) * 100).toFixed(2));
   }
   for (const asset of byAsset) {
     asset.percentage = parseFloat(((asset.value / totalValue) * 100).toFixed(2));
@@ -315,20 +474,10 @@ function calculateAllocation(investments: InvestmentData[]) {
   };
 }
 
-function calculatePerformance(investments: InvestmentData[]) {
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    AMZN: 151.8,
-    TSLA: 242.5,
-    VOO: 425.75,
-    SPY: 458.2,
-  };
-
+function calculatePerformance(investments: Position[]) {
   const performers = investments.map((inv) => {
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
+    const purchasePrice = inv.purchasePrice;
+    const currentPrice = MOCK_CURRENT_PRICES[inv.symbol] || purchasePrice;
     const returnPct = ((currentPrice - purchasePrice) / purchasePrice) * 100;
 
     return {
@@ -349,7 +498,7 @@ function calculatePerformance(investments: InvestmentData[]) {
   };
 }
 
-function calculateRiskMetrics(investments: InvestmentData[]) {
+function calculateRiskMetrics(investments: Position[]) {
   // Simplified risk calculations
   // In production, use historical volatility data
   const volatility = 15 + Math.random() * 10; // Mock 15-25%
@@ -358,11 +507,7 @@ function calculateRiskMetrics(investments: InvestmentData[]) {
   const maxDrawdown = -10 - Math.random() * 20; // Mock -10% to -30%
 
   // Value at Risk (95% confidence)
-  const totalValue = investments.reduce((sum, inv) => {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    return sum + quantity * purchasePrice;
-  }, 0);
+  const totalValue = getPositionColumns(investments).totalCost;
   const var95 = totalValue * (volatility / 100) * 1.645; // 95% confidence
 
   // Determine risk level
@@ -380,7 +525,7 @@ function calculateRiskMetrics(investments: InvestmentData[]) {
   };
 }
 
-function calculateDetailedRisk(investments: InvestmentData[]) {
+function calculateDetailedRisk(investments: Position[]) {
   const basic = calculateRiskMetrics(investments);
 
   // Additional risk factors
@@ -402,73 +547,48 @@ function calculateDetailedRisk(investments: InvestmentData[]) {
   };
 }
 
-function calculateConcentrationRisk(investments: InvestmentData[]) {
+function calculateConcentrationRisk(investments: Position[]) {
   if (investments.length === 0) return 0;
 
-  const values = investments.map((inv) => Number(inv.quantity) * Number(inv.purchasePrice));
-  const total = values.reduce((a, b) => a + b, 0);
-  const percentages = values.map((v) => (v / total) * 100);
+  const { costBasis, totalCost } = getPositionColumns(investments);
 
   // Herfindahl-Hirschman Index style
-  const hhi = percentages.reduce((sum, pct) => sum + Math.pow(pct, 2), 0);
+  let hhi = 0;
+  for (let i = 0; i < costBasis.length; i++) {
+    const pct = (costBasis[i] / totalCost) * 100;
+    hhi += pct * pct;
+  }
   return parseFloat((hhi / 100).toFixed(2)); // Normalized 0-100
 }
 
-function calculateSectorRisk(investments: InvestmentData[]) {
-  const sectors = new Set(investments.filter((i) => i.sector).map((i) => i.sector));
-  const sectorCount = sectors.size || 1;
+function calculateSectorRisk(investments: Position[]) {
+  const sectorCount = classifyPositions(investments).sectors.length || 1;
 
   // More sectors = lower risk
   return parseFloat((100 / sectorCount).toFixed(2));
 }
 
-function calculateLiquidityRisk(investments: InvestmentData[]) {
-  // Crypto and small caps have higher liquidity risk
-  const highRiskTypes = ['CRYPTO', 'OTHER'];
-  const highRiskCount = investments.filter((i) => highRiskTypes.includes(i.type)).length;
+function calculateLiquidityRisk(investments: Position[]) {
+  const highRiskCount = classifyPositions(investments).highLiquidityRiskCount;
 
   return parseFloat(((highRiskCount / Math.max(investments.length, 1)) * 100).toFixed(2));
 }
 
 function calculateRebalanceRecommendations(
-  investments: InvestmentData[],
+  investments: Position[],
   targetAllocation?: Record<string, number>
 ) {
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    VOO: 425.75,
-  };
-
-  // Default balanced allocation
-  const defaultTarget: Record<string, number> = {
-    STOCK: 50,
-    ETF: 30,
-    BOND: 15,
-    CRYPTO: 5,
-  };
-
-  const target = targetAllocation || defaultTarget;
+  const target = targetAllocation || DEFAULT_TARGET_ALLOCATION;
 
   // Calculate current allocation by type
-  let totalValue = 0;
-  const currentByType: Record<string, number> = {};
-
-  for (const inv of investments) {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
-    const value = quantity * currentPrice;
-
-    totalValue += value;
-    currentByType[inv.type] = (currentByType[inv.type] || 0) + value;
-  }
+  const { values, total: totalValue } = marketValues(investments, MOCK_CURRENT_PRICES);
+  const { types, typeIndex } = classifyPositions(investments);
+  const typeTotals = sumByClass(typeIndex, types.length, values);
 
   // Convert to percentages
   const currentPct: Record<string, number> = {};
-  for (const [type, value] of Object.entries(currentByType)) {
-    currentPct[type] = (value / totalValue) * 100;
+  for (let t = 0; t < types.length; t++) {
+    currentPct[types[t]] = (typeTotals[t] / totalValue) * 100;
   }
 
   // Generate recommendations
@@ -506,37 +626,38 @@ function calculateRebalanceRecommendations(
   };
 }
 
-function calculateTaxImpact(investments: InvestmentData[]) {
+function calculateTaxImpact(investments: Position[]) {
   const now = new Date();
-  const oneYearAgo = new Date(now.getFullYear() - 1, now.getMonth(), now.getDate());
-
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    VOO: 425.75,
-  };
-
-  const analysis = investments.map((inv) => {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
-    const purchaseDate = new Date(inv.purchaseDate);
-
-    const gainLoss = (currentPrice - purchasePrice) * quantity;
-    const isLongTerm = purchaseDate < oneYearAgo;
+  const oneYearAgo = new Date(now.getFullYear() - 1, now.getMonth(), now.getDate()).getTime();
+  const { quantity, purchasePrice, purchaseTime } = getPositionColumns(investments);
+  const currentPrice = markPrices(investments, MOCK_CURRENT_PRICES);
+  const daysHeld = daysSince(purchaseTime, now.getTime());
+
+  // Summary totals accumulate alongside the per-position analysis
+  let totalTaxLiability = 0;
+  let totalUnrealizedGains = 0;
+  let totalUnrealizedLosses = 0;
+
+  const analysis = investments.map((inv, i) => {
+    const gainLoss = (currentPrice[i] - purchasePrice[i]) * quantity[i];
+    const isLongTerm = purchaseTime[i] < oneYearAgo;
     const taxRate = isLongTerm ? 0.15 : 0.22;
     const taxImpact = gainLoss > 0 ? gainLoss * taxRate : 0;
-    const daysHeld = Math.floor((now.getTime() - purchaseDate.getTime()) / (1000 * 60 * 60 * 24));
+
+    const roundedGainLoss = parseFloat(gainLoss.toFixed(2));
+    const roundedTaxImpact = parseFloat(taxImpact.toFixed(2));
+    totalTaxLiability += roundedTaxImpact;
+    if (roundedGainLoss > 0) totalUnrealizedGains += roundedGainLoss;
+    else if (roundedGainLoss < 0) totalUnrealizedLosses -= roundedGainLoss;
 
     return {
       symbol: inv.symbol,
-      gainLoss: parseFloat(gainLoss.toFixed(2)),
+      gainLoss: roundedGainLoss,
       isLongTerm,
       taxRate: taxRate * 100,
-      taxImpact: parseFloat(taxImpact.toFixed(2)),
-      daysHeld,
-      daysToLongTerm: isLongTerm ? 0 : Math.max(0, 365 - daysHeld),
+      taxImpact: roundedTaxImpact,
+      daysHeld: daysHeld[i],
+      daysToLongTerm: isLongTerm ? 0 : Math.max(0, 365 - daysHeld[i]),
     };
   });
 
@@ -550,10 +671,6 @@ function calculateTaxImpact(investments: InvestmentData[]) {
     }))
     .sort((a, b) => b.potentialSavings - a.potentialSavings);
 
-  const totalTaxLiability = analysis.reduce((sum, a) => sum + a.taxImpact, 0);
-  const totalUnrealizedGains = analysis.filter((a) => a.gainLoss > 0).reduce((sum, a) => sum + a.gainLoss, 0);
-  const totalUnrealizedLosses = analysis.filter((a) => a.gainLoss < 0).reduce((sum, a) => sum + Math.abs(a.gainLoss), 0);
-
   return {
     positions: analysis,
     summary: {
@@ -565,89 +682,126 @@ function calculateTaxImpact(investments: InvestmentData[]) {
   };
 }
 
-function calculateCorrelationMatrix(investments: InvestmentData[]) {
+/**
+ * Dense correlation matrix: row-major n×n values aligned with `symbols`.
+ * Each pair is scored once and mirrored, indexing holdings directly.
+ */
+function buildCorrelationMatrix(investments: Position[]) {
   // In production, calculate from historical returns
   // For now, return mock correlation data
+  const n = investments.length;
   const symbols = investments.map((i) => i.symbol);
+  const values = new Float64Array(n * n);
+
+  for (let i = 0; i < n; i++) {
+    const inv1 = investments[i];
+    values[i * n + i] = 1.0;
+
+    for (let j = i + 1; j < n; j++) {
+      const inv2 = investments[j];
+      if (inv1.symbol === inv2.symbol) {
+        // Duplicate lots of the same holding
+        values[i * n + j] = values[j * n + i] = 1.0;
+        continue;
+      }
 
-  const matrix: Record<string, Record<string, number>> = {};
+      // Mock correlation based on type similarity
+      const sameType = inv1.type === inv2.type;
+      const sameSector = inv1.sector && inv1.sector === inv2.sector;
 
-  for (const s1 of symbols) {
-    matrix[s1] = {};
-    for (const s2 of symbols) {
-      if (s1 === s2) {
-        matrix[s1][s2] = 1.0;
-      } else {
-        // Mock correlation based on type similarity
-        const inv1 = investments.find((i) => i.symbol === s1);
-        const inv2 = investments.find((i) => i.symbol === s2);
-        const sameType = inv1?.type === inv2?.type;
-        const sameSector = inv1?.sector && inv1.sector === inv2?.sector;
-
-        let correlation = 0.2 + Math.random() * 0.4; // Base 0.2-0.6
-        if (sameType) correlation += 0.2;
-        if (sameSector) correlation += 0.15;
-
-        matrix[s1][s2] = parseFloat(Math.min(correlation, 0.95).toFixed(2));
-      }
+      let correlation = 0.2 + Math.random() * 0.4; // Base 0.2-0.6
+      if (sameType) correlation += 0.2;
+      if (sameSector) correlation += 0.15;
+
+      const rounded = Math.round(Math.min(correlation, 0.95) * 100) / 100;
+      values[i * n + j] = rounded;
+      values[j * n + i] = rounded;
     }
   }
 
+  return { symbols, values };
+}
+
+function calculateCorrelationMatrix(investments: Position[]) {
+  const { symbols, values } = buildCorrelationMatrix(investments);
+  const n = symbols.length;
+
+  const matrix: Record<string, Record<string, number>> = {};
+  for (let i = 0; i < n; i++) {
+    const row: Record<string, number> = {};
+    for (let j = 0; j < n; j++) {
+      row[symbols[j]] = values[i * n + j];
+    }
+    matrix[symbols[i]] = row;
+  }
+
   return {
     symbols,
     matrix,
   };
 }
 
+// GBM assumptions
+const MC_ANNUAL_RETURN = 0.08; // 8% annual return assumption
+const MC_ANNUAL_VOLATILITY = 0.18; // 18% annual volatility assumption
+
+/** Sorted terminal growth factors (final value / initial value), one per scenario */
+function simulateTerminalGrowth(scenarios: number, horizon: number): Float64Array {
+  const growth = new Float64Array(scenarios);
+  const dailyReturn = MC_ANNUAL_RETURN / 252;
+  const dailyVol = MC_ANNUAL_VOLATILITY / Math.sqrt(252);
+  const pairs = horizon >> 1;
+  const odd = (horizon & 1) === 1;
+
+  for (let s = 0; s < scenarios; s++) {
+    let g = 1;
+
+    // Geometric Brownian Motion, consuming both Box-Muller outputs per draw
+    for (let d = 0; d < pairs; d++) {
+      const r = Math.sqrt(-2 * Math.log(1 - Math.random()));
+      const theta = 2 * Math.PI * Math.random();
+      g *= 1 + dailyReturn + dailyVol * r * Math.cos(theta);
+      g *= 1 + dailyReturn + dailyVol * r * Math.sin(theta);
+    }
+    if (odd) {
+      g *= 1 + dailyReturn + dailyVol * normalRandom();
+    }
+
+    growth[s] = g;
+  }
+
+  // Typed-array sort is numeric and avoids the comparator call per element
+  return growth.sort();
+}
+
 function runMonteCarloSimulation(
-  investments: InvestmentData[],
+  investments: Position[],
   scenarios: number,
   horizon: number
 ) {
-  const currentPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    VOO: 425.75,
-  };
-
   // Calculate initial portfolio value
-  let initialValue = 0;
-  for (const inv of investments) {
-    const quantity = Number(inv.quantity);
-    const purchasePrice = Number(inv.purchasePrice);
-    const currentPrice = currentPrices[inv.symbol] || purchasePrice;
-    initialValue += quantity * currentPrice;
-  }
+  const initialValue = dot(
+    getPositionColumns(investments).quantity,
+    markPrices(investments, MOCK_CURRENT_PRICES)
+  );
 
-  // Run simulations
-  const finalValues: number[] = [];
-  const avgReturn = 0.08; // 8% annual return assumption
-  const volatility = 0.18; // 18% annual volatility assumption
-  const dailyReturn = avgReturn / 252;
-  const dailyVol = volatility / Math.sqrt(252);
+  // Run simulations (results come back sorted for percentiles)
+  const growth = simulateTerminalGrowth(scenarios, horizon);
 
+  let sumFinalValues = 0;
+  let losses = 0;
   for (let s = 0; s < scenarios; s++) {
-    let value = initialValue;
-
-    for (let d = 0; d < horizon; d++) {
-      // Geometric Brownian Motion
-      const randomReturn = dailyReturn + dailyVol * normalRandom();
-      value = value * (1 + randomReturn);
-    }
-
-    finalValues.push(value);
+    const value = initialValue * growth[s];
+    sumFinalValues += value;
+    if (value < initialValue) losses++;
   }
 
-  // Sort for percentiles
-  finalValues.sort((a, b) => a - b);
-
   const percentile = (p: number) => {
     const index = Math.floor((p / 100) * scenarios);
-    return parseFloat(finalValues[Math.min(index, scenarios - 1)].toFixed(2));
+    return parseFloat((initialValue * growth[Math.min(index, scenarios - 1)]).toFixed(2));
   };
 
-  const avgFinalValue = finalValues.reduce((a, b) => a + b, 0) / scenarios;
+  const avgFinalValue = sumFinalValues / scenarios;
 
   return {
     initialValue: parseFloat(initialValue.toFixed(2)),
@@ -660,12 +814,10 @@ function runMonteCarloSimulation(
       percentile25: percentile(25),
       percentile75: percentile(75),
       percentile95: percentile(95),
-      minValue: parseFloat(finalValues[0].toFixed(2)),
-      maxValue: parseFloat(finalValues[scenarios - 1].toFixed(2)),
+      minValue: parseFloat((initialValue * growth[0]).toFixed(2)),
+      maxValue: parseFloat((initialValue * growth[scenarios - 1]).toFixed(2)),
     },
-    probabilityOfLoss: parseFloat(
-      ((finalValues.filter((v) => v < initialValue).length / scenarios) * 100).toFixed(2)
-    ),
+    probabilityOfLoss: parseFloat(((losses / scenarios) * 100).toFixed(2)),
   };
 }
 
@@ -0,0 +1,48 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+// Stub the network and external services so provider requests stay in-process.
+vi.mock('undici', () => ({
+  Agent: class {},
+  fetch: vi.fn(),
+}));
+
+vi.mock('../lib/redis.js', () => ({ redis: {} }));
+
+vi.mock('../config/index.js', () => ({
+  config: {
+    apiKeys: {
+      factset: { username: '', apiKey: '' },
+      alphaVantage: '',
+    },
+  },
+}));
+
+import { fetch } from 'undici';
+import { providerRequest } from './market.js';
+
+describe('providerRequest', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('hands every caller its own copy of a cached body', async () => {
+    (fetch as any).mockImplementation(async () =>
+      new Response(JSON.stringify({ quote: { price: 100 } }), { status: 200 })
+    );
+    const url = 'https://provider.test/isolation';
+
+    // Concurrent callers share the in-flight request but not the decoded object
+    const [first, concurrent] = await Promise.all([
+      providerRequest<any>('Test', url, {}, 60),
+      providerRequest<any>('Test', url, {}, 60),
+    ]);
+    first.quote.price = 1;
+    first.mock = true;
+
+    const later = await providerRequest<any>('Test', url, {}, 60);
+
+    expect(concurrent).toEqual({ quote: { price: 100 } });
+    expect(later).toEqual({ quote: { price: 100 } });
+    expect(fetch).toHaveBeenCalledTimes(1);
+  });
+});
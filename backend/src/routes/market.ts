@@ -1,6 +1,12 @@
+import { createHash } from 'crypto';
 import { FastifyInstance, FastifyRequest, FastifyReply } from 'fastify';
+import { Agent, fetch, type RequestInit } from 'undici';
 import { z } from 'zod';
 import { redis } from '../lib/redis.js';
+import { TTLCache } from '../lib/ttlCache.js';
+import { AdaptiveConcurrencyLimiter } from '../lib/concurrencyLimiter.js';
+import { SlidingWindowLimiter, parseRetryAfter } from '../lib/slidingWindowLimiter.js';
+import { TransientError, retryTransient } from '../lib/retry.js';
 import { ApiError } from '../middleware/errorHandler.js';
 import { config } from '../config/index.js';
 
@@ -8,10 +14,69 @@ import { config } from '../config/index.js';
 const CACHE_TTL = {
   QUOTE: 60, // 1 minute
   HISTORICAL: 300, // 5 minutes
-  FUNDAMENTALS: 3600, // 1 hour
+  FUNDAMENTALS: 86400, // 1 day - fundamentals change at most daily
   NEWS: 300, // 5 minutes
 };
 
+// Quote push interval for /stream subscribers
+const STREAM_TICK_MS = 5000;
+
+// In-process provider response TTLs. Prices stay cached for less than one
+// stream tick, so every tick fetches fresh quotes; within a tick, sockets and
+// REST misses asking for the same symbols still share one provider call.
+const PROVIDER_TTL = {
+  PRICES: 4, // seconds, below STREAM_TICK_MS
+};
+
+// Bodies are held as JSON text and decoded per caller, so a handler that
+// adjusts its copy can't change what later callers read
+const providerCache = new TTLCache<string>(5000);
+const providerInFlight = new Map<string, Promise<string>>();
+
+// Serialized fundamentals held in-process in front of Redis (which survives
+// restarts), so hot symbols skip the Redis round trip too
+const FUNDAMENTALS_MEMORY_TTL = 300; // 5 minutes
+const fundamentalsMemory = new TTLCache<string>(1000);
+
+// Shared connection pool for provider hosts. The default dispatcher drops idle
+// sockets after 4s, shorter than the stream tick, so each tick re-did the TLS
+// handshake; keep sockets warm and multiplex over HTTP/2 where offered.
+const providerAgent = new Agent({
+  connections: 64,
+  keepAliveTimeout: 60_000,
+  allowH2: true,
+});
+
+// Per-provider request budgets. In-flight caps adapt on 429/5xx; the
+// requests-per-minute window keeps bursts under the published quotas.
+const PROVIDER_MAX_CONCURRENCY = 8;
+const PROVIDER_RPM: Record<string, number> = {
+  FactSet: 300,
+  'Alpha Vantage': 75,
+};
+const DEFAULT_PROVIDER_RPM = 60;
+const PROVIDER_TIMEOUT_MS = 10_000;
+const TRANSIENT_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+interface ProviderLimits {
+  concurrency: AdaptiveConcurrencyLimiter;
+  rate: SlidingWindowLimiter;
+}
+
+const providerLimits = new Map<string, ProviderLimits>();
+
+function getProviderLimits(provider: string): ProviderLimits {
+  let limits = providerLimits.get(provider);
+  if (!limits) {
+    limits = {
+      concurrency: new AdaptiveConcurrencyLimiter(PROVIDER_MAX_CONCURRENCY),
+      rate: new SlidingWindowLimiter(PROVIDER_RPM[provider] ?? DEFAULT_PROVIDER_RPM),
+    };
+    providerLimits.set(provider, limits);
+  }
+  return limits;
+}
+
 // Validation schemas
 const quoteParamsSchema = z.object({
   symbol: z.string().min(1).max(20),
@@ -27,6 +92,17 @@ const historicalQuerySchema = z.object({
   interval: z.enum(['1d', '1w', '1m']).default('1d'),
 });
 
+/**
+ * Send an already-serialized payload in the standard response envelope.
+ * Cached values are stored as JSON, so they are spliced in as-is rather than
+ * parsed and re-serialized on every hit.
+ */
+function sendSerialized(reply: FastifyReply, json: string, cached: boolean) {
+  return reply
+    .type('application/json; charset=utf-8')
+    .send(`{"success":true,"data":${json},"meta":{"cached":${cached}}}`);
+}
+
 /**
  * Market Data Routes
  * Proxies requests to external APIs (FactSet, Alpha Vantage, etc.)
@@ -46,24 +122,17 @@ export async function marketRoutes(app: FastifyInstance) {
       // Check cache first
       const cached = await redis.get(cacheKey);
       if (cached) {
-        return reply.send({
-          success: true,
-          data: JSON.parse(cached),
-          meta: { cached: true },
-        });
+        return sendSerialized(reply, cached, true);
       }
 
       // Fetch from provider
       const quote = await fetchQuoteFromProvider(symbol.toUpperCase());
 
       // Cache result
-      await redis.setex(cacheKey, CACHE_TTL.QUOTE, JSON.stringify(quote));
+      const serialized = JSON.stringify(quote);
+      await redis.setex(cacheKey, CACHE_TTL.QUOTE, serialized);
 
-      return reply.send({
-        success: true,
-        data: quote,
-        meta: { cached: false },
-      });
+      return sendSerialized(reply, serialized, false);
     }
   );
 
@@ -73,25 +142,37 @@ export async function marketRoutes(app: FastifyInstance) {
    */
   app.post('/quotes', async (request: FastifyRequest, reply: FastifyReply) => {
     const { symbols } = batchQuoteSchema.parse(request.body);
+    const upperSymbols = symbols.map((symbol) => symbol.toUpperCase());
 
-    const quotes = await Promise.all(
-      symbols.map(async (symbol) => {
-        const cacheKey = `quote:${symbol.toUpperCase()}`;
-        const cached = await redis.get(cacheKey);
+    // One round trip for every cached quote
+    const cached = await redis.mget(...upperSymbols.map((symbol) => `quote:${symbol}`));
+    const misses = [...new Set(upperSymbols.filter((_, i) => !cached[i]))];
 
-        if (cached) {
-          return { ...JSON.parse(cached), cached: true };
-        }
+    // One provider request for every miss
+    let fetched = new Map<string, MarketQuote>();
+    if (misses.length > 0) {
+      try {
+        fetched = await fetchQuotesFromProvider(misses);
 
-        try {
-          const quote = await fetchQuoteFromProvider(symbol.toUpperCase());
-          await redis.setex(cacheKey, CACHE_TTL.QUOTE, JSON.stringify(quote));
-          return { ...quote, cached: false };
-        } catch (error) {
-          return { symbol: symbol.toUpperCase(), error: 'Failed to fetch quote' };
+        const pipeline = redis.pipeline();
+        for (const [symbol, quote] of fetched) {
+          pipeline.setex(`quote:${symbol}`, CACHE_TTL.QUOTE, JSON.stringify(quote));
         }
-      })
-    );
+        await pipeline.exec();
+      } catch (error) {
+        console.error('Batch quote error:', error);
+      }
+    }
+
+    const quotes = upperSymbols.map((symbol, i) => {
+      const hit = cached[i];
+      if (hit) {
+        return { ...JSON.parse(hit), cached: true };
+      }
+
+      const quote = fetched.get(symbol);
+      return quote ? { ...quote, cached: false } : { symbol, error: 'Failed to fetch quote' };
+    });
 
     return reply.send({
       success: true,
@@ -119,27 +200,19 @@ export async function marketRoutes(app: FastifyInstance) {
       const cached = await redis.get(cacheKey);
 
       if (cached) {
-        return reply.send({
-          success: true,
-          data: JSON.parse(cached),
-          meta: { cached: true },
-        });
+        return sendSerialized(reply, cached, true);
       }
 
-      const data = await fetchHistoricalFromProvider(
+      const serialized = await fetchHistoricalFromProvider(
         symbol.toUpperCase(),
         query.from ? new Date(query.from) : new Date(Date.now() - 365 * 24 * 60 * 60 * 1000),
         query.to ? new Date(query.to) : new Date(),
         query.interval
       );
 
-      await redis.setex(cacheKey, CACHE_TTL.HISTORICAL, JSON.stringify(data));
+      await redis.setex(cacheKey, CACHE_TTL.HISTORICAL, serialized);
 
-      return reply.send({
-        success: true,
-        data,
-        meta: { cached: false },
-      });
+      return sendSerialized(reply, serialized, false);
     }
   );
 
@@ -153,23 +226,23 @@ export async function marketRoutes(app: FastifyInstance) {
       const { symbol } = quoteParamsSchema.parse(request.params);
       const cacheKey = `fundamentals:${symbol.toUpperCase()}`;
 
+      const inMemory = fundamentalsMemory.get(cacheKey);
+      if (inMemory) {
+        return sendSerialized(reply, inMemory, true);
+      }
+
       const cached = await redis.get(cacheKey);
       if (cached) {
-        return reply.send({
-          success: true,
-          data: JSON.parse(cached),
-          meta: { cached: true },
-        });
+        fundamentalsMemory.set(cacheKey, cached, FUNDAMENTALS_MEMORY_TTL);
+        return sendSerialized(reply, cached, true);
       }
 
       const fundamentals = await fetchFundamentalsFromProvider(symbol.toUpperCase());
-      await redis.setex(cacheKey, CACHE_TTL.FUNDAMENTALS, JSON.stringify(fundamentals));
+      const serialized = JSON.stringify(fundamentals);
+      await redis.setex(cacheKey, CACHE_TTL.FUNDAMENTALS, serialized);
+      fundamentalsMemory.set(cacheKey, serialized, FUNDAMENTALS_MEMORY_TTL);
 
-      return reply.send({
-        success: true,
-        data: fundamentals,
-        meta: { cached: false },
-      });
+      return sendSerialized(reply, serialized, false);
     }
   );
 
@@ -215,11 +288,7 @@ export async function marketRoutes(app: FastifyInstance) {
       const cached = await redis.get(cacheKey);
 
       if (cached) {
-        return reply.send({
-          success: true,
-          data: JSON.parse(cached),
-          meta: { cached: true },
-        });
+        return sendSerialized(reply, cached, true);
       }
 
       const news = await fetchNewsFromProvider(symbols, limit);
@@ -262,11 +331,11 @@ export async function marketRoutes(app: FastifyInstance) {
     const interval = setInterval(async () => {
       if (subscriptions.size === 0) return;
 
-      for (const symbol of subscriptions) {
-        const quote = await fetchQuoteFromProvider(symbol);
+      const quotes = await fetchQuotesFromProvider(Array.from(subscriptions));
+      for (const quote of quotes.values()) {
         socket.send(JSON.stringify({ type: 'quote', data: quote }));
       }
-    }, 5000);
+    }, STREAM_TICK_MS);
 
     socket.on('close', () => {
       clearInterval(interval);
@@ -278,81 +347,217 @@ export async function marketRoutes(app: FastifyInstance) {
 // PROVIDER IMPLEMENTATIONS
 // ============================================================================
 
+// Every quote is built with all fields in this order so they share one object
+// shape; an optional `mock` added only on fallback quotes forked the shape.
+// `mock` is therefore always present in quote responses (false for provider
+// quotes) and is part of the public ApiQuote type.
+interface MarketQuote {
+  symbol: string;
+  price: number;
+  change: number;
+  changePercent: number;
+  volume: number;
+  lastUpdated: string;
+  mock: boolean;
+}
+
 /**
  * Fetch quote from provider chain (FactSet → Alpha Vantage → Mock)
  */
-async function fetchQuoteFromProvider(symbol: string) {
+async function fetchQuoteFromProvider(symbol: string): Promise<MarketQuote> {
+  const quotes = await fetchQuotesFromProvider([symbol]);
+  return quotes.get(symbol)!;
+}
+
+/**
+ * Fetch quotes for many symbols. FactSet is queried once for the whole list;
+ * only symbols it doesn't return fall through to the per-symbol providers.
+ */
+async function fetchQuotesFromProvider(symbols: string[]): Promise<Map<string, MarketQuote>> {
+  const quotes = new Map<string, MarketQuote>();
+
   // Try FactSet first
   if (config.apiKeys.factset.username && config.apiKeys.factset.apiKey) {
     try {
-      return await fetchFromFactSet(symbol);
+      for (const quote of await fetchFromFactSet(symbols)) {
+        quotes.set(quote.symbol, quote);
+      }
     } catch (error) {
-      console.error(`FactSet error for ${symbol}:`, error);
+      console.error(`FactSet error for ${symbols.join(',')}:`, error);
     }
   }
 
-  // Try Alpha Vantage
-  if (config.apiKeys.alphaVantage) {
-    try {
-      return await fetchFromAlphaVantage(symbol);
-    } catch (error) {
-      console.error(`Alpha Vantage error for ${symbol}:`, error);
-    }
+  await Promise.all(
+    symbols
+      .filter((symbol) => !quotes.has(symbol))
+      .map(async (symbol) => {
+        // Try Alpha Vantage
+        if (config.apiKeys.alphaVantage) {
+          try {
+            quotes.set(symbol, await fetchFromAlphaVantage(symbol));
+            return;
+          } catch (error) {
+            console.error(`Alpha Vantage error for ${symbol}:`, error);
+          }
+        }
+
+        // Fallback to mock data
+        quotes.set(symbol, getMockQuote(symbol));
+      })
+  );
+
+  return quotes;
+}
+
+/**
+ * Issue a provider HTTP request, memoizing the JSON response body.
+ * Keyed by (url, method, body) so identical lookups within the TTL skip the network.
+ * Network calls run through the provider's concurrency and requests-per-minute limits,
+ * and transient failures (429/5xx, connection resets) are retried with backoff.
+ * Concurrent callers with the same key share a single in-flight request; every
+ * caller gets its own decoded copy of the body.
+ */
+export async function providerRequest<T>(
+  provider: string,
+  url: string,
+  init: RequestInit,
+  ttlSeconds: number
+): Promise<T> {
+  const key = createHash('sha1')
+    .update(JSON.stringify({ url, method: init.method ?? 'GET', body: init.body ?? null }))
+    .digest('hex');
+
+  const cached = providerCache.get(key);
+  if (cached !== undefined) {
+    return JSON.parse(cached) as T;
+  }
+
+  // Identical concurrent lookups share one network call
+  let body = providerInFlight.get(key);
+  if (!body) {
+    body = sendProviderRequest(provider, url, init)
+      .then((text) => {
+        JSON.parse(text); // don't cache a malformed body
+        providerCache.set(key, text, ttlSeconds);
+        return text;
+      })
+      .finally(() => {
+        providerInFlight.delete(key);
+      });
+    providerInFlight.set(key, body);
   }
 
-  // Fallback to mock data
-  return getMockQuote(symbol);
+  return JSON.parse(await body) as T;
 }
 
-async function fetchFromFactSet(symbol: string) {
-  const credentials = Buffer.from(
-    `${config.apiKeys.factset.username}-serial:${config.apiKeys.factset.apiKey}`
-  ).toString('base64');
+async function sendProviderRequest(
+  provider: string,
+  url: string,
+  init: RequestInit
+): Promise<string> {
+  const { concurrency, rate } = getProviderLimits(provider);
+  return retryTransient(async () => {
+    // Wait for a rate slot before taking an in-flight slot, so a request
+    // queued on the window doesn't hold concurrency it isn't using
+    await rate.acquire();
+    return concurrency.run(async () => {
+      const response = await fetch(url, {
+        ...init,
+        dispatcher: providerAgent,
+        signal: AbortSignal.timeout(PROVIDER_TIMEOUT_MS),
+      });
+      rate.observe(response.status, response.headers);
 
-  const response = await fetch('https://api.factset.com/content/factset-prices/v1/prices', {
-    method: 'POST',
-    headers: {
-      Authorization: `Basic ${credentials}`,
-      'Content-Type': 'application/json',
-    },
-    body: JSON.stringify({
-      ids: [symbol],
-      startDate: new Date().toISOString().split('T')[0],
-      endDate: new Date().toISOString().split('T')[0],
-      frequency: 'D',
-    }),
+      if (response.status === 429 || response.status >= 500) {
+        concurrency.recordOverload();
+      } else {
+        concurrency.recordSuccess();
+      }
+
+      if (TRANSIENT_STATUSES.has(response.status)) {
+        throw new TransientError(
+          `${provider} API error: ${response.status}`,
+          parseRetryAfter(response.headers.get('retry-after'))
+        );
+      }
+      if (!response.ok) {
+        throw new Error(`${provider} API error: ${response.status}`);
+      }
+
+      return response.text();
+    });
   });
+}
 
-  if (!response.ok) {
-    throw new Error(`FactSet API error: ${response.status}`);
-  }
+// Provider endpoints, joined once at startup
+const FACTSET_PRICES_URL = 'https://api.factset.com/content/factset-prices/v1/prices';
+const ALPHA_VANTAGE_QUOTE_URL = `https://www.alphavantage.co/query?function=GLOBAL_QUOTE&apikey=${config.apiKeys.alphaVantage}&symbol=`;
+
+// FactSet credentials are fixed for the process, so the request headers are
+// encoded once rather than re-deriving the Basic auth value on every call
+const FACTSET_HEADERS = {
+  Authorization: `Basic ${Buffer.from(
+    `${config.apiKeys.factset.username}-serial:${config.apiKeys.factset.apiKey}`
+  ).toString('base64')}`,
+  'Content-Type': 'application/json',
+};
+
+async function fetchFromFactSet(symbols: string[]): Promise<MarketQuote[]> {
+  const now = new Date();
+  const today = now.toISOString().slice(0, 10);
+  const lastUpdated = now.toISOString();
+
+  const data: any = await providerRequest(
+    'FactSet',
+    FACTSET_PRICES_URL,
+    {
+      method: 'POST',
+      headers: FACTSET_HEADERS,
+      body: JSON.stringify({
+        ids: symbols,
+        startDate: today,
+        endDate: today,
+        frequency: 'D',
+      }),
+    },
+    PROVIDER_TTL.PRICES
+  );
 
-  const data: any = await response.json();
-  const item = data.data?.[0];
+  const records: any[] = data.data ?? [];
 
-  if (!item) {
+  if (records.length === 0) {
     throw new Error('No data returned from FactSet');
   }
 
-  return {
-    symbol,
-    price: item.price,
-    change: item.change || 0,
-    changePercent: item.changePercent || 0,
-    volume: item.volume || 0,
-    lastUpdated: new Date().toISOString(),
-  };
-}
+  // Records echo the requested id; map each back to its symbol
+  const requested = new Set(symbols);
+  const quotes = new Map<string, MarketQuote>();
 
-async function fetchFromAlphaVantage(symbol: string) {
-  const url = `https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol=${symbol}&apikey=${config.apiKeys.alphaVantage}`;
-  const response = await fetch(url);
+  for (const item of records) {
+    const symbol = symbols.length === 1 ? symbols[0] : item.requestId ?? item.id;
+    if (!requested.has(symbol) || quotes.has(symbol)) continue;
 
-  if (!response.ok) {
-    throw new Error(`Alpha Vantage API error: ${response.status}`);
+    quotes.set(symbol, {
+      symbol,
+      price: item.price,
+      change: item.change || 0,
+      changePercent: item.changePercent || 0,
+      volume: item.volume || 0,
+      lastUpdated,
+      mock: false,
+    });
   }
 
-  const data: any = await response.json();
+  return Array.from(quotes.values());
+}
+
+async function fetchFromAlphaVantage(symbol: string): Promise<MarketQuote> {
+  const data: any = await providerRequest(
+    'Alpha Vantage',
+    ALPHA_VANTAGE_QUOTE_URL + encodeURIComponent(symbol),
+    {},
+    PROVIDER_TTL.PRICES
+  );
   const quote = data['Global Quote'];
 
   if (!quote || !quote['05. price']) {
@@ -366,23 +571,24 @@ async function fetchFromAlphaVantage(symbol: string) {
     changePercent: parseFloat(quote['10. change percent'].replace('%', '')),
     volume: parseInt(quote['06. volume'], 10),
     lastUpdated: new Date().toISOString(),
+    mock: false,
   };
 }
 
-function getMockQuote(symbol: string) {
-  const mockPrices: Record<string, number> = {
-    AAPL: 175.5,
-    MSFT: 295.25,
-    GOOGL: 142.3,
-    AMZN: 151.8,
-    TSLA: 242.5,
-    VOO: 425.75,
-    SPY: 458.2,
-    BTC: 52000,
-    ETH: 3200,
-  };
+const MOCK_PRICES: Record<string, number> = {
+  AAPL: 175.5,
+  MSFT: 295.25,
+  GOOGL: 142.3,
+  AMZN: 151.8,
+  TSLA: 242.5,
+  VOO: 425.75,
+  SPY: 458.2,
+  BTC: 52000,
+  ETH: 3200,
+};
 
-  const basePrice = mockPrices[symbol] || 100;
+function getMockQuote(symbol: string): MarketQuote {
+  const basePrice = MOCK_PRICES[symbol] || 100;
   const fluctuation = (Math.random() - 0.5) * 2;
   const price = basePrice * (1 + fluctuation / 100);
   const change = price - basePrice;
@@ -398,16 +604,26 @@ function getMockQuote(symbol: string) {
   };
 }
 
+/** Round to 2 decimals numerically (avoids the toFixed/parseFloat string round trip) */
+function roundCents(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+/**
+ * Fetch a historical series already serialized as JSON, ready to cache and
+ * send without a second stringify in the route.
+ */
 async function fetchHistoricalFromProvider(
   symbol: string,
   from: Date,
   to: Date,
   interval: string
-) {
+): Promise<string> {
   // In production, implement real provider calls
   // For now, return mock data
   const data = [];
   const current = new Date(from);
+  const stepDays = interval === '1w' ? 7 : interval === '1m' ? 30 : 1;
   let price = 100;
 
   while (current <= to) {
@@ -415,57 +631,57 @@ async function fetchHistoricalFromProvider(
     price = price * (1 + change / 100);
 
     data.push({
-      date: current.toISOString().split('T')[0],
-      open: parseFloat((price * 0.99).toFixed(2)),
-      high: parseFloat((price * 1.02).toFixed(2)),
-      low: parseFloat((price * 0.98).toFixed(2)),
-      close: parseFloat(price.toFixed(2)),
+      date: current.toISOString().slice(0, 10),
+      open: roundCents(price * 0.99),
+      high: roundCents(price * 1.02),
+      low: roundCents(price * 0.98),
+      close: roundCents(price),
       volume: Math.floor(Math.random() * 10000000),
     });
 
-    current.setDate(current.getDate() + (interval === '1w' ? 7 : interval === '1m' ? 30 : 1));
+    current.setDate(current.getDate() + stepDays);
   }
 
-  return { symbol, interval, data };
+  return JSON.stringify({ symbol, interval, data });
 }
 
+const MOCK_FUNDAMENTALS: Record<string, any> = {
+  AAPL: {
+    symbol: 'AAPL',
+    companyName: 'Apple Inc.',
+    sector: 'Technology',
+    industry: 'Consumer Electronics',
+    marketCap: 2750000000000,
+    pe: 28.5,
+    eps: 6.16,
+    revenue: 383285000000,
+    revenueGrowth: 0.03,
+    netIncome: 96995000000,
+    netMargin: 0.253,
+    roe: 1.474,
+    roa: 0.283,
+  },
+  MSFT: {
+    symbol: 'MSFT',
+    companyName: 'Microsoft Corporation',
+    sector: 'Technology',
+    industry: 'Software',
+    marketCap: 2200000000000,
+    pe: 31.2,
+    eps: 9.72,
+    revenue: 211915000000,
+    revenueGrowth: 0.07,
+    netIncome: 72738000000,
+    netMargin: 0.343,
+    roe: 0.423,
+    roa: 0.186,
+  },
+};
+
 async function fetchFundamentalsFromProvider(symbol: string) {
   // In production, implement real provider calls
-  const mockFundamentals: Record<string, any> = {
-    AAPL: {
-      symbol: 'AAPL',
-      companyName: 'Apple Inc.',
-      sector: 'Technology',
-      industry: 'Consumer Electronics',
-      marketCap: 2750000000000,
-      pe: 28.5,
-      eps: 6.16,
-      revenue: 383285000000,
-      revenueGrowth: 0.03,
-      netIncome: 96995000000,
-      netMargin: 0.253,
-      roe: 1.474,
-      roa: 0.283,
-    },
-    MSFT: {
-      symbol: 'MSFT',
-      companyName: 'Microsoft Corporation',
-      sector: 'Technology',
-      industry: 'Software',
-      marketCap: 2200000000000,
-      pe: 31.2,
-      eps: 9.72,
-      revenue: 211915000000,
-      revenueGrowth: 0.07,
-      netIncome: 72738000000,
-      netMargin: 0.343,
-      roe: 0.423,
-      roa: 0.186,
-    },
-  };
-
   return (
-    mockFundamentals[symbol] || {
+    MOCK_FUNDAMENTALS[symbol] || {
       symbol,
       companyName: `${symbol} Corporation`,
       sector: 'Unknown',
@@ -477,23 +693,30 @@ async function fetchFundamentalsFromProvider(symbol: string) {
   );
 }
 
+const SYMBOL_DIRECTORY = [
+  { symbol: 'AAPL', name: 'Apple Inc.', type: 'stock' },
+  { symbol: 'MSFT', name: 'Microsoft Corporation', type: 'stock' },
+  { symbol: 'GOOGL', name: 'Alphabet Inc.', type: 'stock' },
+  { symbol: 'AMZN', name: 'Amazon.com Inc.', type: 'stock' },
+  { symbol: 'TSLA', name: 'Tesla Inc.', type: 'stock' },
+  { symbol: 'VOO', name: 'Vanguard S&P 500 ETF', type: 'etf' },
+  { symbol: 'SPY', name: 'SPDR S&P 500 ETF', type: 'etf' },
+  { symbol: 'BTC', name: 'Bitcoin', type: 'crypto' },
+  { symbol: 'ETH', name: 'Ethereum', type: 'crypto' },
+];
+
+// Lower-cased search keys, computed once rather than per query
+const SYMBOL_SEARCH_INDEX = SYMBOL_DIRECTORY.map((s) => ({
+  entry: s,
+  symbol: s.symbol.toLowerCase(),
+  name: s.name.toLowerCase(),
+}));
+
 async function searchSymbols(query: string) {
   // In production, implement real search
-  const allSymbols = [
-    { symbol: 'AAPL', name: 'Apple Inc.', type: 'stock' },
-    { symbol: 'MSFT', name: 'Microsoft Corporation', type: 'stock' },
-    { symbol: 'GOOGL', name: 'Alphabet Inc.', type: 'stock' },
-    { symbol: 'AMZN', name: 'Amazon.com Inc.', type: 'stock' },
-    { symbol: 'TSLA', name: 'Tesla Inc.', type: 'stock' },
-    { symbol: 'VOO', name: 'Vanguard S&P 500 ETF', type: 'etf' },
-    { symbol: 'SPY', name: 'SPDR S&P 500 ETF', type: 'etf' },
-    { symbol: 'BTC', name: 'Bitcoin', type: 'crypto' },
-    { symbol: 'ETH', name: 'Ethereum', type: 'crypto' },
-  ];
-
   const q = query.toLowerCase();
-  return allSymbols.filter(
-    (s) => s.symbol.toLowerCase().includes(q) || s.name.toLowerCase().includes(q)
+  return SYMBOL_SEARCH_INDEX.filter((s) => s.symbol.includes(q) || s.name.includes(q)).map(
+    (s) => s.entry
   );
 }
 
@@ -6,6 +6,22 @@ interface CorrelationMatrixProps {
   investments: Investment[]
 }
 
+// Mock correlation based on asset type similarity
+function mockCorrelation(inv1: Investment, inv2: Investment): number {
+  // Same type = higher correlation
+  if (inv1.type === inv2.type) {
+    return 0.6 + Math.random() * 0.3 // 0.6-0.9
+  } else if (
+    (inv1.type === 'stock' && inv2.type === 'etf') ||
+    (inv1.type === 'etf' && inv2.type === 'stock')
+  ) {
+    return 0.4 + Math.random() * 0.3 // 0.4-0.7
+  } else if (inv1.type === 'bond' || inv2.type === 'bond') {
+    return -0.1 + Math.random() * 0.2 // -0.1-0.1 (slightly negative to neutral)
+  }
+  return Math.random() * 0.4 // 0-0.4
+}
+
 export default function CorrelationMatrix({ investments }: CorrelationMatrixProps) {
   const [correlationData, setCorrelationData] = useState<CorrelationData | null>(null)
 
@@ -18,36 +34,43 @@ export default function CorrelationMatrix({ investments }: CorrelationMatrixProp
     // In production, calculate correlations using historical price data
     // For now, generate mock correlations based on sector/type similarity
     const symbols = investments.map(inv => inv.symbol)
-    const matrix: Record<string, Record<string, number>> = {}
+    const n = symbols.length
 
-    // Initialize matrix
-    symbols.forEach(symbol1 => {
-      matrix[symbol1] = {}
-      symbols.forEach(symbol2 => {
-        if (symbol1 === symbol2) {
-          matrix[symbol1][symbol2] = 1.0
-        } else {
-          // Mock correlation based on asset type similarity
-          const inv1 = investments.find(i => i.symbol === symbol1)!
-          const inv2 = investments.find(i => i.symbol === symbol2)!
-          
-          // Same type = higher correlation
-          if (inv1.type === inv2.type) {
-            matrix[symbol1][symbol2] = 0.6 + Math.random() * 0.3 // 0.6-0.9
-          } else if (
-            (inv1.type === 'stock' && inv2.type === 'etf') ||
-            (inv1.type === 'etf' && inv2.type === 'stock')
-          ) {
-            matrix[symbol1][symbol2] = 0.4 + Math.random() * 0.3 // 0.4-0.7
-          } else if (inv1.type === 'bond' || inv2.type === 'bond') {
-            matrix[symbol1][symbol2] = -0.1 + Math.random() * 0.2 // -0.1-0.1 (slightly negative to neutral)
-          } else {
-            matrix[symbol1][symbol2] = Math.random() * 0.4 // 0-0.4
-          }
-        }
-      })
+    // First holding per symbol, indexed once instead of searched for every pair
+    const bySymbol = new Map<string, Investment>()
+    investments.forEach(inv => {
+      if (!bySymbol.has(inv.symbol)) bySymbol.set(inv.symbol, inv)
     })
 
+    // Dense n×n matrix. Correlation is symmetric, so each pair is scored once
+    // and mirrored, and the row/column layout question disappears; the
+    // diversification total accumulates in the same pass.
+    const dense = new Float64Array(n * n)
+    let totalCorrelation = 0
+    let count = 0
+    for (let i = 0; i < n; i++) {
+      dense[i * n + i] = 1.0
+      for (let j = i + 1; j < n; j++) {
+        const sameSymbol = symbols[i] === symbols[j]
+        const correlation = sameSymbol
+          ? 1.0
+          : mockCorrelation(bySymbol.get(symbols[i])!, bySymbol.get(symbols[j])!)
+        dense[i * n + j] = correlation
+        dense[j * n + i] = correlation
+        if (!sameSymbol) {
+          totalCorrelation += 2 * Math.abs(correlation)
+          count += 2
+        }
+      }
+    }
+
+    const matrix: Record<string, Record<string, number>> = {}
+    for (let i = 0; i < n; i++) {
+      const row: Record<string, number> = {}
+      for (let j = 0; j < n; j++) row[symbols[j]] = dense[i * n + j]
+      matrix[symbols[i]] = row
+    }
+
     // Calculate average correlations to find clusters
     const clusters: CorrelationData['clusters'] = []
 
@@ -75,16 +98,6 @@ export default function CorrelationMatrix({ investments }: CorrelationMatrixProp
     })
 
     // Calculate diversification score
-    let totalCorrelation = 0
-    let count = 0
-    symbols.forEach(s1 => {
-      symbols.forEach(s2 => {
-        if (s1 !== s2) {
-          totalCorrelation += Math.abs(matrix[s1][s2])
-          count++
-        }
-      })
-    })
     const avgCorrelation = count > 0 ? totalCorrelation / count : 0
     const diversificationScore = Math.max(0, Math.min(100, (1 - avgCorrelation) * 100))
 
@@ -28,32 +28,48 @@ export function MonteCarloSimulation({
     const monthsPerYear = 12
     const totalMonths = yearsToUse * monthsPerYear
     const dt = 1 / monthsPerYear
-    
-    const allPaths: number[][] = []
-    const finalValues: number[] = []
-    
-    // Run simulations
-    for (let sim = 0; sim < simulations; sim++) {
-      const path: number[] = [initialValue]
-      let currentValue = initialValue
-      
-      for (let month = 1; month <= totalMonths; month++) {
-        const randomShock = (Math.random() - 0.5) * 2
-        const drift = expectedReturn * dt
-        const diffusion = volatility * Math.sqrt(dt) * randomShock
-        const return_ = drift + diffusion
-        currentValue = currentValue * (1 + return_)
-        path.push(currentValue)
+    const drift = expectedReturn * dt
+    const diffusion = volatility * Math.sqrt(dt)
+
+    // Draw the whole (months × simulations) block of shocks at once as
+    // monthly growth factors
+    const growth = new Float64Array(totalMonths * simulations)
+    for (let i = 0; i < growth.length; i++) {
+      const randomShock = (Math.random() - 0.5) * 2
+      growth[i] = 1 + drift + diffusion * randomShock
+    }
+
+    // Time-major paths: row m holds every simulation's value at month m, and
+    // each row is the previous one compounded by that month's growth factors
+    const paths = new Float64Array((totalMonths + 1) * simulations)
+    paths.fill(initialValue, 0, simulations)
+    for (let month = 1; month <= totalMonths; month++) {
+      const row = month * simulations
+      const prev = row - simulations
+      for (let sim = 0; sim < simulations; sim++) {
+        paths[row + sim] = paths[prev + sim] * growth[prev + sim]
       }
-      
-      allPaths.push(path)
-      finalValues.push(currentValue)
     }
-    
-    // Calculate statistics
-    finalValues.sort((a, b) => a - b)
+
+    // Percentile paths from each month's row, sorted in place
+    const chartData = []
+    for (let month = 0; month <= totalMonths; month++) {
+      const monthValues = paths.subarray(month * simulations, (month + 1) * simulations).sort()
+      chartData.push({
+        month,
+        year: (month / monthsPerYear).toFixed(1),
+        p10: monthValues[Math.floor(simulations * 0.1)],
+        p50: monthValues[Math.floor(simulations * 0.5)],
+        p90: monthValues[Math.floor(simulations * 0.9)]
+      })
+    }
+
+    // Calculate statistics from the final row (already sorted)
+    const finalValues = paths.subarray(totalMonths * simulations)
+    let total = 0
+    for (let i = 0; i < simulations; i++) total += finalValues[i]
     const median = finalValues[Math.floor(simulations / 2)]
-    const mean = finalValues.reduce((a, b) => a + b, 0) / simulations
+    const mean = total / simulations
     const p10 = finalValues[Math.floor(simulations * 0.1)]
     const p25 = finalValues[Math.floor(simulations * 0.25)]
     const p75 = finalValues[Math.floor(simulations * 0.75)]
@@ -61,33 +77,8 @@ export function MonteCarloSimulation({
     const p95 = finalValues[Math.floor(simulations * 0.95)]
     const worst = finalValues[0]
     const best = finalValues[finalValues.length - 1]
-    
-    // Calculate percentile paths
-    const p10Path: number[] = []
-    const p50Path: number[] = []
-    const p90Path: number[] = []
-    
-    for (let month = 0; month <= totalMonths; month++) {
-      const monthValues = allPaths.map(path => path[month]).sort((a, b) => a - b)
-      p10Path.push(monthValues[Math.floor(simulations * 0.1)])
-      p50Path.push(monthValues[Math.floor(simulations * 0.5)])
-      p90Path.push(monthValues[Math.floor(simulations * 0.9)])
-    }
-    
-    // Format chart data
-    const chartData = []
-    for (let month = 0; month <= totalMonths; month++) {
-      chartData.push({
-        month,
-        year: (month / monthsPerYear).toFixed(1),
-        p10: p10Path[month],
-        p50: p50Path[month],
-        p90: p90Path[month]
-      })
-    }
-    
+
     return {
-      paths: allPaths.slice(0, 50), // Show only 50 paths for performance
       statistics: { median, mean, p10, p25, p75, p90, p95, worst, best },
       percentiles: chartData
     }
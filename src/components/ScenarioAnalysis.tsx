@@ -1,5 +1,6 @@
-import React, { useState } from 'react'
+import React, { useMemo, useState } from 'react'
 import { Investment } from '../types'
+import { buildShockMatrix, getHoldingColumns, projectScenarios, scenarioShock, sumByClass } from '../services/analytics'
 import { TrendingDown, AlertTriangle, DollarSign, Activity } from 'lucide-react'
 
 interface ScenarioAnalysisProps {
@@ -129,10 +130,26 @@ const SCENARIOS: Scenario[] = [
   }
 ]
 
+const SHOCK_MATRIX = buildShockMatrix(SCENARIOS, scenario => scenario.impacts)
+
 export const ScenarioAnalysis: React.FC<ScenarioAnalysisProps> = ({ investments }) => {
   const [selectedScenario, setSelectedScenario] = useState<string>(SCENARIOS[0].id)
 
-  const calculateScenarioImpact = (scenario: Scenario) => {
+  // Current value per asset type (types in order of first appearance), summed
+  // over the cached holding columns
+  const exposure = useMemo(() => {
+    const { values, totalValue, types, typeIds } = getHoldingColumns(investments)
+    return { total: totalValue, types, byType: sumByClass(typeIds, types.length, values) }
+  }, [investments])
+
+  // Projected portfolio value for every scenario: total + shocks · exposure
+  const projectedValues = useMemo(() => {
+    const projected = projectScenarios(exposure.byType, exposure.types, SHOCK_MATRIX)
+    for (let s = 0; s < projected.length; s++) projected[s] += exposure.total
+    return projected
+  }, [exposure])
+
+  const calculateScenarioImpact = (scenarioIndex: number) => {
     if (investments.length === 0) {
       return {
         currentValue: 0,
@@ -143,24 +160,14 @@ export const ScenarioAnalysis: React.FC<ScenarioAnalysisProps> = ({ investments
       }
     }
 
-    let currentValue = 0
-    let projectedValue = 0
+    const currentValue = exposure.total
+    const projectedValue = projectedValues[scenarioIndex]
     const byAssetType: Record<string, { current: number, projected: number, impact: number }> = {}
 
-    investments.forEach(inv => {
-      const value = inv.quantity * inv.currentPrice
-      const impact = scenario.impacts[inv.type] || 0
-      const newValue = value * (1 + impact)
-
-      currentValue += value
-      projectedValue += newValue
-
-      if (!byAssetType[inv.type]) {
-        byAssetType[inv.type] = { current: 0, projected: 0, impact: 0 }
-      }
-      byAssetType[inv.type].current += value
-      byAssetType[inv.type].projected += newValue
-      byAssetType[inv.type].impact = impact
+    exposure.types.forEach((type, t) => {
+      const current = exposure.byType[t]
+      const impact = scenarioShock(SHOCK_MATRIX, type, scenarioIndex)
+      byAssetType[type] = { current, projected: current * (1 + impact), impact }
     })
 
     return {
@@ -172,8 +179,9 @@ export const ScenarioAnalysis: React.FC<ScenarioAnalysisProps> = ({ investments
     }
   }
 
-  const selectedScenarioObj = SCENARIOS.find(s => s.id === selectedScenario) || SCENARIOS[0]
-  const impact = calculateScenarioImpact(selectedScenarioObj)
+  const selectedIndex = SHOCK_MATRIX.scenarioIndex.get(selectedScenario) ?? 0
+  const selectedScenarioObj = SCENARIOS[selectedIndex]
+  const impact = calculateScenarioImpact(selectedIndex)
 
   return (
     <div className="scenario-analysis">
@@ -8,9 +8,9 @@
  * - Optimistic updates
  */
 
-import { createContext, useContext, useState, useEffect, useCallback, useRef, ReactNode } from 'react';
+import { createContext, useContext, useState, useEffect, useCallback, useMemo, useRef, ReactNode } from 'react';
 import { api, ApiInvestment, ApiPortfolio, ApiPortfolioDetail, ApiPortfolioSummary } from '../services/api';
-import { realTimeMarket } from '../services/realTimeMarket';
+import { realTimeMarket, type Quote } from '../services/realTimeMarket';
 import type {
   Portfolio as DomainPortfolio,
   Investment as DomainInvestment,
@@ -366,12 +366,67 @@ const safeLocalStorage = {
   },
 };
 
+// Rebuild an investment with every field present in declaration order, so all
+// holdings share one object shape no matter where they came from (storage,
+// sample data, the add form). Spread updates then keep that shape.
+const toInvestmentRecord = (inv: Investment): Investment => ({
+  id: inv.id,
+  name: inv.name,
+  symbol: inv.symbol,
+  type: inv.type,
+  quantity: inv.quantity,
+  purchasePrice: inv.purchasePrice,
+  currentPrice: inv.currentPrice,
+  purchaseDate: inv.purchaseDate,
+  sector: inv.sector,
+  notes: inv.notes,
+  dayChange: inv.dayChange,
+  dayChangePercent: inv.dayChangePercent,
+});
+
+// Positions of each (upper-cased) symbol in an investments array. Keyed by array
+// identity; a quote update keeps every symbol in its slot, so the index carries over.
+const symbolIndexes = new WeakMap<Investment[], Map<string, number[]>>();
+
+const getSymbolIndex = (list: Investment[]): Map<string, number[]> => {
+  let index = symbolIndexes.get(list);
+  if (!index) {
+    index = new Map();
+    for (let i = 0; i < list.length; i++) {
+      const key = list[i].symbol.toUpperCase();
+      const slots = index.get(key);
+      if (slots) slots.push(i);
+      else index.set(key, [i]);
+    }
+    symbolIndexes.set(list, index);
+  }
+  return index;
+};
+
+const applyQuote = (list: Investment[], quote: Quote): Investment[] => {
+  const index = getSymbolIndex(list);
+  const slots = index.get(quote.symbol.toUpperCase());
+  if (!slots) return list;
+
+  const next = list.slice();
+  for (const i of slots) {
+    next[i] = {
+      ...next[i],
+      currentPrice: quote.price,
+      dayChange: quote.change,
+      dayChangePercent: quote.changePercent,
+    };
+  }
+  symbolIndexes.set(next, index);
+  return next;
+};
+
 export function PortfolioProvider({ children }: { children: ReactNode }) {
   const [portfolios, setPortfolios] = useState<Portfolio[]>([]);
   const [activePortfolio, setActivePortfolio] = useState<Portfolio | null>(null);
   const [investments, setInvestments] = useState<Investment[]>(() => {
     const { value } = readFirstJson<Investment[]>(STORAGE_KEYS.investments);
-    return Array.isArray(value) ? value : getSamplePortfolio();
+    return (Array.isArray(value) ? value : getSamplePortfolio()).map(toInvestmentRecord);
   });
   const [transactions, setTransactions] = useState<Transaction[]>(() => {
     const { value } = readFirstJson<Transaction[]>(STORAGE_KEYS.transactions);
@@ -499,17 +554,7 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
     let unsubscribe: (() => void) | undefined;
     
     realTimeMarket.subscribe(symbols, (quote) => {
-      setInvestments(prev => prev.map(inv => {
-        if (inv.symbol.toUpperCase() === quote.symbol.toUpperCase()) {
-          return {
-            ...inv,
-            currentPrice: quote.price,
-            dayChange: quote.change,
-            dayChangePercent: quote.changePercent,
-          };
-        }
-        return inv;
-      }));
+      setInvestments(prev => applyQuote(prev, quote));
     }).then(unsub => {
       unsubscribe = unsub;
     }).catch(() => {
@@ -646,13 +691,13 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
     investment: Omit<Investment, 'id' | 'currentPrice' | 'dayChange' | 'dayChangePercent'>
   ): Promise<Investment | null> => {
     // For demo mode without backend
-    const newInvestment: Investment = {
+    const newInvestment = toInvestmentRecord({
       ...investment,
       id: Date.now().toString(),
       currentPrice: investment.purchasePrice,
       dayChange: 0,
       dayChangePercent: 0,
-    };
+    });
     
     // Optimistic update
     setInvestments(prev => [...prev, newInvestment]);
@@ -702,9 +747,10 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
   }, [activePortfolio]);
 
   const updateInvestment = useCallback(async (id: string, updates: Partial<Investment>): Promise<boolean> => {
-    // Optimistic update
+    // Optimistic update; re-normalized so stray keys in `updates` don't
+    // change the record's shape
     setInvestments(prev => prev.map(inv => 
-      inv.id === id ? { ...inv, ...updates } : inv
+      inv.id === id ? toInvestmentRecord({ ...inv, ...updates }) : inv
     ));
     
     // If connected to backend, sync
@@ -720,7 +766,7 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
         // Rollback on failure
         setInvestments(prev => {
           const { value } = readFirstJson<Investment[]>(STORAGE_KEYS.investments);
-          return Array.isArray(value) ? value : prev;
+          return Array.isArray(value) ? value.map(toInvestmentRecord) : prev;
         });
         setError(response.error?.message || 'Failed to update investment');
         return false;
@@ -731,10 +777,19 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
   }, [activePortfolio]);
 
   const deleteInvestment = useCallback(async (id: string): Promise<boolean> => {
-    const deletedInvestment = investments.find(inv => inv.id === id);
+    const deletedIndex = investments.findIndex(inv => inv.id === id);
+    const deletedInvestment = deletedIndex >= 0 ? investments[deletedIndex] : undefined;
     
-    // Optimistic update
-    setInvestments(prev => prev.filter(inv => inv.id !== id));
+    // Optimistic update. Holdings keep their display order, so this is an
+    // indexed splice rather than a swap-remove; an unknown id keeps the same
+    // array (and the stats memoized on it).
+    setInvestments(prev => {
+      const index = prev.findIndex(inv => inv.id === id);
+      if (index < 0) return prev;
+      const next = prev.slice();
+      next.splice(index, 1);
+      return next;
+    });
     setTransactions(prev => prev.filter(t => t.investmentId !== id));
     
     // If connected to backend, sync
@@ -744,7 +799,11 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
       if (!response.success) {
         // Rollback on failure
         if (deletedInvestment) {
-          setInvestments(prev => [...prev, deletedInvestment]);
+          setInvestments(prev => {
+            const next = prev.slice();
+            next.splice(Math.min(deletedIndex, next.length), 0, deletedInvestment);
+            return next;
+          });
         }
         setError(response.error?.message || 'Failed to delete investment');
         return false;
@@ -762,21 +821,29 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
       id: Date.now().toString(),
     };
     
-    // Update investment quantity based on transaction
-    setInvestments(prev => prev.map(inv => {
-      if (inv.id === transaction.investmentId) {
-        let newQuantity = inv.quantity;
-        if (transaction.type === 'buy') {
-          newQuantity += transaction.quantity;
-        } else if (transaction.type === 'sell') {
-          newQuantity -= transaction.quantity;
-        } else if (transaction.type === 'split') {
-          newQuantity *= transaction.quantity;
-        }
-        return { ...inv, quantity: newQuantity };
+    // Update investment quantity based on transaction. Only the one slot
+    // changes, so the symbol index carries over; transactions that leave the
+    // quantity alone (dividends, fees, ...) keep the same array.
+    setInvestments(prev => {
+      const i = prev.findIndex(inv => inv.id === transaction.investmentId);
+      if (i < 0) return prev;
+
+      let newQuantity = prev[i].quantity;
+      if (transaction.type === 'buy') {
+        newQuantity += transaction.quantity;
+      } else if (transaction.type === 'sell') {
+        newQuantity -= transaction.quantity;
+      } else if (transaction.type === 'split') {
+        newQuantity *= transaction.quantity;
       }
-      return inv;
-    }));
+      if (newQuantity === prev[i].quantity) return prev;
+
+      const next = prev.slice();
+      next[i] = { ...prev[i], quantity: newQuantity };
+      const index = symbolIndexes.get(prev);
+      if (index) symbolIndexes.set(next, index);
+      return next;
+    });
     
     setTransactions(prev => [...prev, newTransaction]);
     
@@ -835,9 +902,13 @@ export function PortfolioProvider({ children }: { children: ReactNode }) {
     }
   }, [investments]);
 
-  // Calculate portfolio stats
-  const stats: PortfolioStats = calculateStats(investments);
-  const riskMetrics: RiskMetrics = calculateRiskMetrics(investments);
+  // Calculate portfolio stats. State updates replace the investments array, so
+  // its identity doubles as the version key; loading/error renders reuse these.
+  const stats: PortfolioStats = useMemo(() => calculateStats(investments), [investments]);
+  const riskMetrics: RiskMetrics = useMemo(
+    () => calculateRiskMetrics(investments, stats.totalValue),
+    [investments, stats.totalValue]
+  );
 
   return (
     <PortfolioContext.Provider value={{
@@ -876,22 +947,26 @@ function calculateStats(investments: Investment[]): PortfolioStats {
     };
   }
 
-  const totalValue = investments.reduce((sum, inv) => sum + (inv.quantity * inv.currentPrice), 0);
-  const totalInvested = investments.reduce((sum, inv) => sum + (inv.quantity * inv.purchasePrice), 0);
+  // Value, cost and day change accumulate in a single pass
+  let totalValue = 0;
+  let totalInvested = 0;
+  let dayChange = 0;
+  for (const inv of investments) {
+    totalValue += inv.quantity * inv.currentPrice;
+    totalInvested += inv.quantity * inv.purchasePrice;
+    dayChange += (inv.dayChange || 0) * inv.quantity;
+  }
   const totalGainLoss = totalValue - totalInvested;
   const gainLossPercentage = totalInvested > 0 ? (totalGainLoss / totalInvested) * 100 : 0;
-
-  // Calculate day change
-  const dayChange = investments.reduce((sum, inv) => {
-    return sum + (inv.dayChange || 0) * inv.quantity;
-  }, 0);
   const dayChangePercentage = totalValue > 0 ? (dayChange / (totalValue - dayChange)) * 100 : 0;
 
   // Calculate best and worst performers
-  const performances = investments.map(inv => ({
-    name: inv.name,
-    percentage: ((inv.currentPrice - inv.purchasePrice) / inv.purchasePrice) * 100
-  })).sort((a, b) => b.percentage - a.percentage);
+  let returnSum = 0;
+  const performances = investments.map(inv => {
+    const percentage = ((inv.currentPrice - inv.purchasePrice) / inv.purchasePrice) * 100;
+    returnSum += percentage;
+    return { name: inv.name, percentage };
+  }).sort((a, b) => b.percentage - a.percentage);
 
   // Diversification score (0-100)
   const sectors = new Set(investments.map(inv => inv.sector || inv.type));
@@ -904,14 +979,14 @@ function calculateStats(investments: Investment[]): PortfolioStats {
     gainLossPercentage,
     bestPerformer: performances[0],
     worstPerformer: performances[performances.length - 1],
-    averageReturn: performances.reduce((sum, p) => sum + p.percentage, 0) / performances.length,
+    averageReturn: returnSum / performances.length,
     diversificationScore,
     dayChange,
     dayChangePercentage,
   };
 }
 
-function calculateRiskMetrics(investments: Investment[]): RiskMetrics {
+function calculateRiskMetrics(investments: Investment[], totalValue: number): RiskMetrics {
   if (investments.length === 0) {
     return {
       portfolioVolatility: 0,
@@ -923,19 +998,22 @@ function calculateRiskMetrics(investments: Investment[]): RiskMetrics {
     };
   }
 
-  const totalValue = investments.reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0);
-
-  const cryptoWeight = investments
-    .filter(inv => inv.type === 'crypto')
-    .reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0) / totalValue;
-
-  const stockWeight = investments
-    .filter(inv => inv.type === 'stock')
-    .reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0) / totalValue;
+  // One pass for the asset-mix weights and the value-weighted return
+  let cryptoValue = 0;
+  let stockValue = 0;
+  let bondValue = 0;
+  let weightedReturn = 0;
+  for (const inv of investments) {
+    const value = inv.quantity * inv.currentPrice;
+    if (inv.type === 'crypto') cryptoValue += value;
+    else if (inv.type === 'stock') stockValue += value;
+    else if (inv.type === 'bond') bondValue += value;
+    weightedReturn += ((inv.currentPrice - inv.purchasePrice) / inv.purchasePrice) * 100 * value;
+  }
 
-  const bondWeight = investments
-    .filter(inv => inv.type === 'bond')
-    .reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0) / totalValue;
+  const cryptoWeight = cryptoValue / totalValue;
+  const stockWeight = stockValue / totalValue;
+  const bondWeight = bondValue / totalValue;
 
   // Volatility based on asset mix
   const portfolioVolatility = 15 + (cryptoWeight * 50) + (stockWeight * 5) - (bondWeight * 10);
@@ -944,11 +1022,7 @@ function calculateRiskMetrics(investments: Investment[]): RiskMetrics {
   const beta = 1 + (cryptoWeight * 0.5) - (bondWeight * 0.3);
   
   // Sharpe ratio
-  const expectedReturn = investments.reduce((sum, inv) => {
-    const ret = ((inv.currentPrice - inv.purchasePrice) / inv.purchasePrice) * 100;
-    const weight = (inv.quantity * inv.currentPrice) / totalValue;
-    return sum + ret * weight;
-  }, 0);
+  const expectedReturn = weightedReturn / totalValue;
   const sharpeRatio = portfolioVolatility > 0 ? (expectedReturn - 5) / portfolioVolatility : 0;
 
   // Max drawdown and VaR
@@ -35,6 +35,7 @@ import {
 import { KPICard, KPIGrid } from '../components/ui';
 import { useShell } from '../layouts';
 import { usePortfolio } from '../contexts/PortfolioContext';
+import { getHoldingColumns, sumByClass } from '../services/analytics';
 
 const SECTOR_COLORS: Record<string, string> = {
   'Technology': '#58a6ff',
@@ -96,18 +97,13 @@ export default function DashboardPage() {
 
   // Sector allocation from real holdings
   const sectorAllocation = useMemo(() => {
-    const sectorTotals: Record<string, number> = {};
-    
-    investments.forEach(inv => {
-      const sector = inv.sector || 'Other';
-      const value = inv.quantity * inv.currentPrice;
-      sectorTotals[sector] = (sectorTotals[sector] || 0) + value;
-    });
+    const { values, sectors, sectorIds } = getHoldingColumns(investments);
+    const sectorTotals = sumByClass(sectorIds, sectors.length, values);
 
-    return Object.entries(sectorTotals)
-      .map(([name, value]) => ({
+    return sectors
+      .map((name, s) => ({
         name,
-        value: stats.totalValue > 0 ? Math.round((value / stats.totalValue) * 100) : 0,
+        value: stats.totalValue > 0 ? Math.round((sectorTotals[s] / stats.totalValue) * 100) : 0,
         color: SECTOR_COLORS[name] || '#6e7681',
       }))
       .sort((a, b) => b.value - a.value)
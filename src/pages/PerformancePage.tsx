@@ -28,14 +28,17 @@ import {
 } from '../features/performance';
 import './pages.css';
 
+const DATE_LABEL_FORMAT = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' });
+
 // Generate mock historical data
 function generateHistoricalData(currentValue: number, days: number) {
   const data = [];
   let value = currentValue * (1 - (Math.random() * 0.3 + 0.1)); // Start lower
   const dailyReturn = Math.pow(currentValue / value, 1 / days);
+  const today = new Date();
   
   for (let i = days; i >= 0; i--) {
-    const date = new Date();
+    const date = new Date(today);
     date.setDate(date.getDate() - i);
     
     // Add some volatility
@@ -48,7 +51,7 @@ function generateHistoricalData(currentValue: number, days: number) {
     
     data.push({
       date: date.toISOString().split('T')[0],
-      dateLabel: date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
+      dateLabel: DATE_LABEL_FORMAT.format(date),
       portfolio: Math.round(value),
       benchmark: Math.round(benchmarkValue),
     });
@@ -58,6 +61,15 @@ function generateHistoricalData(currentValue: number, days: number) {
 
 type TimeRange = '1M' | '3M' | '6M' | 'YTD' | '1Y' | 'ALL';
 
+const RANGE_DAYS: Record<Exclude<TimeRange, 'YTD'>, number> = {
+  '1M': 30, '3M': 90, '6M': 180, '1Y': 365, 'ALL': 730,
+};
+
+function daysInRange(range: TimeRange): number {
+  if (range !== 'YTD') return RANGE_DAYS[range];
+  return Math.floor((Date.now() - new Date(new Date().getFullYear(), 0, 1).getTime()) / (1000 * 60 * 60 * 24));
+}
+
 export default function PerformancePage() {
   const { investments, stats } = usePortfolio();
   const [timeRange, setTimeRange] = useState<TimeRange>('1Y');
@@ -94,15 +106,14 @@ export default function PerformancePage() {
       : <ArrowDown size={12} className="sort-icon--active" />;
   };
 
-  // Generate historical data based on time range
-  const daysMap: Record<TimeRange, number> = {
-    '1M': 30, '3M': 90, '6M': 180, 'YTD': Math.floor((Date.now() - new Date(new Date().getFullYear(), 0, 1).getTime()) / (1000 * 60 * 60 * 24)),
-    '1Y': 365, 'ALL': 730,
-  };
+  // Generate historical data based on time range. The day count is a plain
+  // number, so the series (and the metrics below) only regenerate when the
+  // range or portfolio value actually changes, not on every render.
+  const days = daysInRange(timeRange);
 
   const historicalData = useMemo(() => 
-    generateHistoricalData(stats.totalValue, daysMap[timeRange]),
-    [stats.totalValue, timeRange, daysMap]
+    generateHistoricalData(stats.totalValue, days),
+    [stats.totalValue, days]
   );
 
   // Calculate performance metrics
@@ -120,16 +131,17 @@ export default function PerformancePage() {
     const alpha = totalReturn - benchmarkReturn;
     
     // Calculate max drawdown
-    let peak = historicalData[0].portfolio;
+    let peak = startValue;
     let maxDrawdown = 0;
-    historicalData.forEach(d => {
-      if (d.portfolio > peak) peak = d.portfolio;
-      const drawdown = ((peak - d.portfolio) / peak) * 100;
+    for (let i = 1; i < historicalData.length; i++) {
+      const value = historicalData[i].portfolio;
+      if (value > peak) peak = value;
+      const drawdown = ((peak - value) / peak) * 100;
       if (drawdown > maxDrawdown) maxDrawdown = drawdown;
-    });
+    }
 
     // Annualized return
-    const years = daysMap[timeRange] / 365;
+    const years = days / 365;
     const annualizedReturn = (Math.pow(endValue / startValue, 1 / years) - 1) * 100;
 
     return {
@@ -139,17 +151,22 @@ export default function PerformancePage() {
       maxDrawdown,
       annualizedReturn,
     };
-  }, [historicalData, timeRange, daysMap]);
+  }, [historicalData, days]);
 
   // Individual holding performance
+  // Return and contribution both derive from the per-share gain, computed once
   const holdingPerformance = useMemo(() => {
-    return investments.map(inv => ({
-      symbol: inv.symbol,
-      name: inv.name,
-      return: ((inv.currentPrice - inv.purchasePrice) / inv.purchasePrice) * 100,
-      value: inv.quantity * inv.currentPrice,
-      contribution: ((inv.currentPrice - inv.purchasePrice) * inv.quantity / stats.totalValue) * 100,
-    })).sort((a, b) => b.return - a.return);
+    const contributionScale = 100 / stats.totalValue;
+    return investments.map(inv => {
+      const gain = inv.currentPrice - inv.purchasePrice;
+      return {
+        symbol: inv.symbol,
+        name: inv.name,
+        return: (gain / inv.purchasePrice) * 100,
+        value: inv.quantity * inv.currentPrice,
+        contribution: gain * inv.quantity * contributionScale,
+      };
+    }).sort((a, b) => b.return - a.return);
   }, [investments, stats.totalValue]);
 
   // Monthly returns
@@ -26,6 +26,7 @@ import {
 } from 'lucide-react';
 import { PieChart, Pie, Cell, ResponsiveContainer, Tooltip } from 'recharts';
 import { usePortfolio } from '../contexts/PortfolioContext';
+import { getHoldingColumns, sumByClass } from '../services/analytics';
 import { useShell } from '../layouts';
 import './pages.css';
 
@@ -57,42 +58,38 @@ export default function PortfolioOverviewPage() {
   const [sectorFilter, setSectorFilter] = useState<string | null>(null);
 
   const allocationByType = useMemo(() => {
-    const totals: Record<string, number> = {};
-    investments.forEach(inv => {
-      const value = inv.quantity * inv.currentPrice;
-      totals[inv.type] = (totals[inv.type] || 0) + value;
-    });
-    return Object.entries(totals)
-      .map(([name, value]) => ({
+    const { values, types, typeIds } = getHoldingColumns(investments);
+    const totals = sumByClass(typeIds, types.length, values);
+    return types
+      .map((name, t) => ({
         name: formatTypeName(name),
         rawName: name,
-        value,
-        percent: stats.totalValue > 0 ? (value / stats.totalValue) * 100 : 0,
+        value: totals[t],
+        percent: stats.totalValue > 0 ? (totals[t] / stats.totalValue) * 100 : 0,
       }))
       .sort((a, b) => b.value - a.value);
   }, [investments, stats.totalValue]);
 
   const allocationBySector = useMemo(() => {
-    const totals: Record<string, number> = {};
-    investments.forEach(inv => {
-      const sector = inv.sector || 'Other';
-      const value = inv.quantity * inv.currentPrice;
-      totals[sector] = (totals[sector] || 0) + value;
-    });
-    return Object.entries(totals)
-      .map(([name, value]) => ({
+    const { values, sectors, sectorIds } = getHoldingColumns(investments);
+    const totals = sumByClass(sectorIds, sectors.length, values);
+    return sectors
+      .map((name, s) => ({
         name,
-        value,
-        percent: stats.totalValue > 0 ? (value / stats.totalValue) * 100 : 0,
+        value: totals[s],
+        percent: stats.totalValue > 0 ? (totals[s] / stats.totalValue) * 100 : 0,
       }))
       .sort((a, b) => b.value - a.value);
   }, [investments, stats.totalValue]);
 
   const filteredHoldings = useMemo(() => {
-    let filtered = [...investments];
-    if (allocationFilter) filtered = filtered.filter(inv => inv.type === allocationFilter);
-    if (sectorFilter) filtered = filtered.filter(inv => (inv.sector || 'Other') === sectorFilter);
-    
+    // One pass over holdings; each active filter is a single field check
+    const filtered = allocationFilter || sectorFilter
+      ? investments.filter(inv =>
+          (!allocationFilter || inv.type === allocationFilter) &&
+          (!sectorFilter || (inv.sector || 'Other') === sectorFilter))
+      : investments;
+
     return filtered
       .map(inv => ({
         ...inv,
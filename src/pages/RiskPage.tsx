@@ -12,6 +12,7 @@ import {
 } from 'recharts';
 import { Shield, AlertTriangle, TrendingDown, Activity, Target, Gauge, Columns, ArrowUp, ArrowDown, ArrowUpDown } from 'lucide-react';
 import { usePortfolio } from '../contexts/PortfolioContext';
+import { getHoldingColumns, sumByClass } from '../services/analytics';
 import { KPICard, KPIGrid } from '../components/ui';
 import {
   ColumnCustomizationDialog,
@@ -29,6 +30,11 @@ import {
 } from '../features/risk';
 import './pages.css';
 
+// Simulated annual volatility by asset type
+function baseVolatility(type: string): number {
+  return type === 'crypto' ? 0.6 : type === 'stock' ? 0.25 : 0.1;
+}
+
 export default function RiskPage() {
   const { investments, stats, riskMetrics } = usePortfolio();
 
@@ -65,46 +71,40 @@ export default function RiskPage() {
 
   // Risk breakdown by holding
   const riskByHolding = useMemo(() => {
+    const percentOfTotal = 100 / stats.totalValue;
     return investments.map(inv => {
       const value = inv.quantity * inv.currentPrice;
-      const weight = value / stats.totalValue;
       // Simulate volatility based on asset type
-      const baseVol = inv.type === 'crypto' ? 0.6 : inv.type === 'stock' ? 0.25 : 0.1;
-      const volatility = baseVol * (0.8 + Math.random() * 0.4);
-      const riskContribution = weight * volatility;
-      
+      const volatility = baseVolatility(inv.type) * (0.8 + Math.random() * 0.4);
+      // Dollar volatility feeds both the risk contribution and the VaR
+      const dollarVolatility = value * volatility;
+
       return {
         symbol: inv.symbol,
         name: inv.name,
-        weight: weight * 100,
+        weight: value * percentOfTotal,
         volatility: volatility * 100,
-        riskContribution: riskContribution * 100,
-        var95: value * volatility * 1.65,
+        riskContribution: dollarVolatility * percentOfTotal,
+        var95: dollarVolatility * 1.65,
       };
     }).sort((a, b) => b.riskContribution - a.riskContribution);
   }, [investments, stats.totalValue]);
 
-  // Risk by sector
+  // Risk by sector, over the interned sector/type ids of the holding columns
   const riskBySector = useMemo(() => {
-    const sectorData: Record<string, { value: number; risk: number }> = {};
-    
-    investments.forEach(inv => {
-      const sector = inv.sector || 'Other';
-      const value = inv.quantity * inv.currentPrice;
-      const baseVol = inv.type === 'crypto' ? 0.6 : inv.type === 'stock' ? 0.25 : 0.1;
-      
-      if (!sectorData[sector]) {
-        sectorData[sector] = { value: 0, risk: 0 };
-      }
-      sectorData[sector].value += value;
-      sectorData[sector].risk += value * baseVol;
-    });
+    const { values, types, typeIds, sectors, sectorIds } = getHoldingColumns(investments);
+    const typeVol = types.map(baseVolatility);
+    const sectorValue = sumByClass(sectorIds, sectors.length, values);
+    const sectorRisk = new Float64Array(sectors.length);
+    for (let i = 0; i < values.length; i++) {
+      sectorRisk[sectorIds[i]] += values[i] * typeVol[typeIds[i]];
+    }
 
-    return Object.entries(sectorData).map(([sector, data]) => ({
+    return sectors.map((sector, s) => ({
       sector,
-      value: data.value,
-      weight: (data.value / stats.totalValue) * 100,
-      risk: (data.risk / stats.totalValue) * 100,
+      value: sectorValue[s],
+      weight: (sectorValue[s] / stats.totalValue) * 100,
+      risk: (sectorRisk[s] / stats.totalValue) * 100,
     })).sort((a, b) => b.risk - a.risk);
   }, [investments, stats.totalValue]);
 
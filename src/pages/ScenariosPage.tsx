@@ -11,6 +11,13 @@ import {
 } from 'recharts';
 import { AlertTriangle, TrendingDown, TrendingUp, Play, RefreshCw } from 'lucide-react';
 import { usePortfolio } from '../contexts/PortfolioContext';
+import {
+  buildShockMatrix,
+  getHoldingColumns,
+  projectScenarios,
+  scenarioShock,
+  sumByClass,
+} from '../services/analytics';
 import { KPICard, KPIGrid } from '../components/ui';
 import './pages.css';
 
@@ -66,33 +73,39 @@ const SCENARIOS = [
   },
 ];
 
-// Monte Carlo simulation
-function runMonteCarloSimulation(startValue: number, years: number, runs: number): number[][] {
-  const results: number[][] = [];
+const SHOCK_MATRIX = buildShockMatrix(SCENARIOS, scenario => scenario.impact);
+
+// Monte Carlo simulation. Runs advance in lockstep: each day updates every
+// run's value from one contiguous buffer, and a monthly snapshot copies that
+// buffer into a time-major grid (point m of all runs at [m * runs, (m + 1) * runs)).
+function runMonteCarloSimulation(startValue: number, years: number, runs: number) {
   const annualReturn = 0.08;
   const volatility = 0.18;
   const daysPerYear = 252;
   const totalDays = years * daysPerYear;
-  
-  for (let run = 0; run < runs; run++) {
-    const path: number[] = [startValue];
-    let value = startValue;
-    
-    for (let day = 1; day <= totalDays; day++) {
-      const dailyReturn = annualReturn / daysPerYear;
-      const dailyVol = volatility / Math.sqrt(daysPerYear);
-      const randomShock = (Math.random() + Math.random() + Math.random() - 1.5) * 2; // Approx normal
-      const change = dailyReturn + dailyVol * randomShock;
-      value *= (1 + change);
-      
-      if (day % 21 === 0) { // Monthly data points
-        path.push(value);
-      }
+  const dailyReturn = annualReturn / daysPerYear;
+  const dailyVol = volatility / Math.sqrt(daysPerYear);
+  // Loop invariants of the daily growth factor, hoisted out of the inner loop
+  const drift = 1 + dailyReturn;
+  const shockScale = dailyVol * 2;
+
+  const points = Math.floor(totalDays / 21) + 1;
+  const paths = new Float64Array(points * runs);
+  const values = new Float64Array(runs).fill(startValue);
+  paths.set(values, 0);
+
+  for (let day = 1; day <= totalDays; day++) {
+    for (let run = 0; run < runs; run++) {
+      const randomShock = Math.random() + Math.random() + Math.random() - 1.5; // Approx normal
+      values[run] *= drift + shockScale * randomShock;
+    }
+
+    if (day % 21 === 0) { // Monthly data points
+      paths.set(values, (day / 21) * runs);
     }
-    results.push(path);
   }
-  
-  return results;
+
+  return { paths, points };
 }
 
 export default function ScenariosPage() {
@@ -101,42 +114,40 @@ export default function ScenariosPage() {
   const [monteCarloRuns, setMonteCarloRuns] = useState(100);
   const [runSimulation, setRunSimulation] = useState(false);
 
-  // Calculate scenario impacts
+  // Calculate scenario impacts for every scenario in one pass over the
+  // per-type exposure vector
   const scenarioResults = useMemo(() => {
-    return SCENARIOS.map(scenario => {
-      let impactedValue = 0;
-      
-      investments.forEach(inv => {
-        const currentValue = inv.quantity * inv.currentPrice;
-        const impact = scenario.impact[inv.type] || 0;
-        impactedValue += currentValue * (1 + impact);
-      });
-      
-      const dollarImpact = impactedValue - stats.totalValue;
-      const percentImpact = (dollarImpact / stats.totalValue) * 100;
-      
+    const { values, totalValue, types, typeIds } = getHoldingColumns(investments);
+    const exposure = sumByClass(typeIds, types.length, values);
+    const change = projectScenarios(exposure, types, SHOCK_MATRIX);
+
+    return SCENARIOS.map((scenario, s) => {
+      const dollarImpact = change[s];
+      const percentImpact = (dollarImpact / totalValue) * 100;
+
       return {
         ...scenario,
-        newValue: impactedValue,
+        newValue: totalValue + dollarImpact,
         dollarImpact,
         percentImpact,
       };
     });
-  }, [investments, stats.totalValue]);
+  }, [investments]);
 
   // Selected scenario details
-  const selectedScenarioData = useMemo(() => {
-    if (!selectedScenario) return null;
-    return scenarioResults.find(s => s.id === selectedScenario);
-  }, [selectedScenario, scenarioResults]);
+  const selectedIndex = selectedScenario ? SHOCK_MATRIX.scenarioIndex.get(selectedScenario) : undefined;
+  const selectedScenarioData = selectedIndex === undefined ? null : scenarioResults[selectedIndex];
 
-  // Impact by holding for selected scenario
+  // Impact by holding for selected scenario; shocks are resolved once per
+  // asset type from the shock matrix, not per holding
   const holdingImpacts = useMemo(() => {
-    if (!selectedScenarioData) return [];
-    
-    return investments.map(inv => {
-      const currentValue = inv.quantity * inv.currentPrice;
-      const impact = selectedScenarioData.impact[inv.type] || 0;
+    if (selectedIndex === undefined) return [];
+    const { values, types, typeIds } = getHoldingColumns(investments);
+    const shocks = types.map(type => scenarioShock(SHOCK_MATRIX, type, selectedIndex));
+
+    return investments.map((inv, i) => {
+      const currentValue = values[i];
+      const impact = shocks[typeIds[i]];
       const newValue = currentValue * (1 + impact);
       
       return {
@@ -148,32 +159,35 @@ export default function ScenariosPage() {
         percentChange: impact * 100,
       };
     }).sort((a, b) => a.dollarChange - b.dollarChange);
-  }, [investments, selectedScenarioData]);
+  }, [investments, selectedIndex]);
 
   // Monte Carlo results
   const monteCarloResults = useMemo(() => {
     if (!runSimulation) return null;
     
-    const simulations = runMonteCarloSimulation(stats.totalValue, 5, monteCarloRuns);
-    const months = simulations[0].length;
+    const { paths, points } = runMonteCarloSimulation(stats.totalValue, 5, monteCarloRuns);
+    const runs = monteCarloRuns;
     
-    // Calculate percentiles at each time point
+    // Calculate percentiles at each time point; each month's row is sorted in place
     const chartData = [];
-    for (let m = 0; m < months; m++) {
-      const values = simulations.map(sim => sim[m]).sort((a, b) => a - b);
+    for (let m = 0; m < points; m++) {
+      const values = paths.subarray(m * runs, (m + 1) * runs).sort();
       chartData.push({
         month: m,
-        p5: values[Math.floor(values.length * 0.05)],
-        p25: values[Math.floor(values.length * 0.25)],
-        median: values[Math.floor(values.length * 0.5)],
-        p75: values[Math.floor(values.length * 0.75)],
-        p95: values[Math.floor(values.length * 0.95)],
+        p5: values[Math.floor(runs * 0.05)],
+        p25: values[Math.floor(runs * 0.25)],
+        median: values[Math.floor(runs * 0.5)],
+        p75: values[Math.floor(runs * 0.75)],
+        p95: values[Math.floor(runs * 0.95)],
       });
     }
     
-    // Final values for distribution
-    const finalValues = simulations.map(sim => sim[sim.length - 1]);
-    const sortedFinal = [...finalValues].sort((a, b) => a - b);
+    // Final values for distribution (the last row, already sorted)
+    const sortedFinal = paths.subarray((points - 1) * runs);
+    let profitable = 0;
+    for (let i = 0; i < runs; i++) {
+      if (sortedFinal[i] > stats.totalValue) profitable++;
+    }
     
     return {
       chartData,
@@ -183,7 +197,7 @@ export default function ScenariosPage() {
         median: sortedFinal[Math.floor(sortedFinal.length * 0.5)],
         p95: sortedFinal[Math.floor(sortedFinal.length * 0.95)],
         best: sortedFinal[sortedFinal.length - 1],
-        probProfit: sortedFinal.filter(v => v > stats.totalValue).length / sortedFinal.length * 100,
+        probProfit: profitable / runs * 100,
       },
     };
   }, [runSimulation, stats.totalValue, monteCarloRuns]);
@@ -1,11 +1,16 @@
-import { ReactNode } from 'react';
+import { ReactNode, useEffect } from 'react';
 import Login from '../components/Login';
 import { useAuth } from '../contexts/AuthContext';
 import { LoadingOverlay } from '../components/ui';
+import { prefetchAnalyticsPages } from './pageLoaders';
 
 export function AuthGate({ children }: { children: ReactNode }) {
   const { isAuthenticated, loading, login, register } = useAuth();
 
+  useEffect(() => {
+    if (isAuthenticated) prefetchAnalyticsPages();
+  }, [isAuthenticated]);
+
   if (loading) {
     return <LoadingOverlay message="Loading..." />;
   }
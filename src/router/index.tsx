@@ -10,16 +10,22 @@ import { createBrowserRouter, Navigate, Outlet } from 'react-router-dom';
 import { AppShell } from '../layouts';
 import { LoadingOverlay } from '../components/ui';
 import { AuthGate } from './AuthGate';
+import {
+  loadPerformancePage,
+  loadRiskPage,
+  loadScenariosPage,
+  loadCorrelationPage,
+} from './pageLoaders';
 
 // Lazy load pages for code splitting
 const DashboardPage = lazy(() => import('../pages/DashboardPage'));
 const PortfolioOverviewPage = lazy(() => import('../pages/PortfolioOverviewPage'));
 const PositionsPage = lazy(() => import('../pages/PositionsPage'));
 const TransactionsPage = lazy(() => import('../pages/TransactionsPage'));
-const PerformancePage = lazy(() => import('../pages/PerformancePage'));
-const RiskPage = lazy(() => import('../pages/RiskPage'));
-const ScenariosPage = lazy(() => import('../pages/ScenariosPage'));
-const CorrelationPage = lazy(() => import('../pages/CorrelationPage'));
+const PerformancePage = lazy(loadPerformancePage);
+const RiskPage = lazy(loadRiskPage);
+const ScenariosPage = lazy(loadScenariosPage);
+const CorrelationPage = lazy(loadCorrelationPage);
 const EquityResearchPage = lazy(() => import('../pages/EquityResearchPage'));
 const ThemesPage = lazy(() => import('../pages/ThemesPage'));
 const NotesPage = lazy(() => import('../pages/NotesPage'));
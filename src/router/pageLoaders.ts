@@ -0,0 +1,39 @@
+/**
+ * Page Loaders
+ *
+ * Dynamic imports for the analytics pages, shared by the route table and
+ * the post-login prefetch so both resolve the same chunks.
+ */
+
+export const loadPerformancePage = () => import('../pages/PerformancePage');
+export const loadRiskPage = () => import('../pages/RiskPage');
+export const loadScenariosPage = () => import('../pages/ScenariosPage');
+export const loadCorrelationPage = () => import('../pages/CorrelationPage');
+
+let prefetched = false;
+
+// Warm the analytics page chunks once the user is signed in and the browser is
+// idle, so the first visit doesn't wait on downloading and compiling them.
+// Skipped when the user asked the browser to save data. A failed prefetch is
+// harmless: the route just loads on demand as before.
+export function prefetchAnalyticsPages() {
+  if (prefetched || typeof window === 'undefined') return;
+  const connection = (navigator as Navigator & { connection?: { saveData?: boolean } }).connection;
+  if (connection?.saveData) return;
+  prefetched = true;
+
+  const prefetch = () => {
+    Promise.all([
+      loadPerformancePage(),
+      loadRiskPage(),
+      loadScenariosPage(),
+      loadCorrelationPage(),
+    ]).catch(() => {});
+  };
+
+  if ('requestIdleCallback' in window) {
+    window.requestIdleCallback(prefetch);
+  } else {
+    setTimeout(prefetch, 2000);
+  }
+}
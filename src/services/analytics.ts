@@ -1,5 +1,127 @@
 import { Investment, Alert, RebalanceRecommendation } from '../types';
 
+/**
+ * Holdings as parallel columns: market value per position plus interned
+ * type/sector ids (missing sectors count as 'Other'). Built once per
+ * investments array; state updates always produce a new array.
+ */
+export interface HoldingColumns {
+  values: Float64Array;
+  totalValue: number;
+  types: string[];
+  typeIds: Int32Array;
+  sectors: string[];
+  sectorIds: Int32Array;
+}
+
+const holdingColumns = new WeakMap<Investment[], HoldingColumns>();
+
+function intern(ids: Map<string, number>, keys: string[], key: string): number {
+  let id = ids.get(key);
+  if (id === undefined) {
+    id = keys.push(key) - 1;
+    ids.set(key, id);
+  }
+  return id;
+}
+
+export function getHoldingColumns(investments: Investment[]): HoldingColumns {
+  let columns = holdingColumns.get(investments);
+  if (!columns) {
+    const n = investments.length;
+    const typeIndex = new Map<string, number>();
+    const sectorIndex = new Map<string, number>();
+    columns = {
+      values: new Float64Array(n),
+      totalValue: 0,
+      types: [],
+      typeIds: new Int32Array(n),
+      sectors: [],
+      sectorIds: new Int32Array(n),
+    };
+    for (let i = 0; i < n; i++) {
+      const inv = investments[i];
+      const value = inv.quantity * inv.currentPrice;
+      columns.values[i] = value;
+      columns.totalValue += value;
+      columns.typeIds[i] = intern(typeIndex, columns.types, inv.type);
+      columns.sectorIds[i] = intern(sectorIndex, columns.sectors, inv.sector || 'Other');
+    }
+    holdingColumns.set(investments, columns);
+  }
+  return columns;
+}
+
+/** Sum `weights` into one bucket per class id (a weighted bincount) */
+export function sumByClass(ids: Int32Array, classCount: number, weights: Float64Array): Float64Array {
+  const totals = new Float64Array(classCount);
+  for (let i = 0; i < ids.length; i++) totals[ids[i]] += weights[i];
+  return totals;
+}
+
+/**
+ * Stress-test shocks per (asset type, scenario), stored column-major so each
+ * asset type's shocks are contiguous across scenarios. Asset types a scenario
+ * doesn't list are stored as 0; scenarios are also indexed by id.
+ */
+export interface ShockMatrix {
+  shocks: Float64Array;
+  scenarioCount: number;
+  scenarioIndex: Map<string, number>;
+  typeIndex: Map<string, number>;
+}
+
+export function buildShockMatrix<S extends { id: string }>(
+  scenarios: S[],
+  getImpact: (scenario: S) => Record<string, number | undefined>
+): ShockMatrix {
+  const n = scenarios.length;
+  const typeIndex = new Map<string, number>();
+  const types: string[] = [];
+  scenarios.forEach(scenario => {
+    Object.keys(getImpact(scenario)).forEach(type => intern(typeIndex, types, type));
+  });
+
+  const shocks = new Float64Array(n * types.length);
+  types.forEach((type, f) => {
+    scenarios.forEach((scenario, s) => {
+      shocks[f * n + s] = getImpact(scenario)[type] || 0;
+    });
+  });
+
+  return {
+    shocks,
+    scenarioCount: n,
+    scenarioIndex: new Map(scenarios.map((scenario, s) => [scenario.id, s])),
+    typeIndex,
+  };
+}
+
+/** Shock of `type` under scenario `s`; 0 for asset types no scenario moves */
+export function scenarioShock(matrix: ShockMatrix, type: string, s: number): number {
+  const f = matrix.typeIndex.get(type);
+  return f === undefined ? 0 : matrix.shocks[f * matrix.scenarioCount + s];
+}
+
+/**
+ * Change in portfolio value under every scenario at once (shocks · exposure),
+ * given the value held per asset type. One scaled column per asset type the
+ * portfolio actually holds.
+ */
+export function projectScenarios(exposure: Float64Array, types: string[], matrix: ShockMatrix): Float64Array {
+  const n = matrix.scenarioCount;
+  const change = new Float64Array(n);
+  for (let t = 0; t < types.length; t++) {
+    const f = matrix.typeIndex.get(types[t]);
+    if (f === undefined || exposure[t] === 0) continue;
+    const offset = f * n;
+    for (let s = 0; s < n; s++) {
+      change[s] += exposure[t] * matrix.shocks[offset + s];
+    }
+  }
+  return change;
+}
+
 export function generateAlerts(investments: Investment[]): Alert[] {
   const alerts: Alert[] = [];
   const now = new Date().toISOString();
@@ -49,10 +171,9 @@ export function generateAlerts(investments: Investment[]): Alert[] {
   }
 
   // Check for concentration risk
-  const totalValue = investments.reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0);
-  investments.forEach(inv => {
-    const positionValue = inv.quantity * inv.currentPrice;
-    const percentage = (positionValue / totalValue) * 100;
+  const { values: positionValues, totalValue } = getHoldingColumns(investments);
+  investments.forEach((inv, i) => {
+    const percentage = (positionValues[i] / totalValue) * 100;
     
     if (percentage > 30) {
       alerts.push({
@@ -94,14 +215,17 @@ export function generateRebalanceRecommendation(
   targetAllocations?: Record<string, number>
 ): RebalanceRecommendation {
   // Calculate current allocation by type
-  const totalValue = investments.reduce((sum, inv) => sum + inv.quantity * inv.currentPrice, 0);
+  const { values, totalValue, types, typeIds } = getHoldingColumns(investments);
+  const typeTotals = sumByClass(typeIds, types.length, values);
   const currentAllocation: Record<string, number> = {};
+  for (let t = 0; t < types.length; t++) {
+    currentAllocation[types[t]] = (typeTotals[t] / totalValue) * 100;
+  }
 
-  investments.forEach(inv => {
-    const value = inv.quantity * inv.currentPrice;
-    const percentage = (value / totalValue) * 100;
-    currentAllocation[inv.type] = (currentAllocation[inv.type] || 0) + percentage;
-  });
+  const firstOfType = new Map<string, Investment>();
+  for (const inv of investments) {
+    if (!firstOfType.has(inv.type)) firstOfType.set(inv.type, inv);
+  }
 
   // Default target allocation if not provided (balanced portfolio)
   const defaultTargets = {
@@ -122,9 +246,8 @@ export function generateRebalanceRecommendation(
     const diff = current - targetPct;
 
     if (Math.abs(diff) > 5) { // Only recommend if difference > 5%
-      const investmentsOfType = investments.filter(inv => inv.type === type);
-      if (investmentsOfType.length > 0) {
-        const inv = investmentsOfType[0]; // Use first investment of this type
+      const inv = firstOfType.get(type); // Use first investment of this type
+      if (inv) {
         const targetValue = (targetPct / 100) * totalValue;
         const currentValue = (current / 100) * totalValue;
         const valueDiff = targetValue - currentValue;
@@ -25,9 +25,26 @@ interface RequestOptions extends RequestInit {
   skipAuth?: boolean;
 }
 
+// Refresh this long before the access token's `exp` to absorb clock skew
+const TOKEN_REFRESH_SKEW_MS = 30_000;
+
+/** Read the `exp` claim of a JWT in epoch ms (0 when absent or unparseable) */
+function readTokenExpiry(token: string | null): number {
+  if (!token) return 0;
+  try {
+    const payload = token.split('.')[1].replace(/-/g, '+').replace(/_/g, '/');
+    const exp = JSON.parse(atob(payload)).exp;
+    return typeof exp === 'number' ? exp * 1000 : 0;
+  } catch {
+    return 0;
+  }
+}
+
 class ApiClient {
   private token: string | null = null;
   private refreshToken: string | null = null;
+  private tokenExpiresAt = 0;
+  private refreshInFlight: Promise<boolean> | null = null;
 
   constructor() {
     // Load tokens from storage (safely handle sandboxed environments)
@@ -39,11 +56,13 @@ class ApiClient {
       this.token = null;
       this.refreshToken = null;
     }
+    this.tokenExpiresAt = readTokenExpiry(this.token);
   }
 
   setTokens(access: string, refresh: string) {
     this.token = access;
     this.refreshToken = refresh;
+    this.tokenExpiresAt = readTokenExpiry(access);
     try {
       localStorage.setItem('auth_token', access);
       localStorage.setItem('refresh_token', refresh);
@@ -55,6 +74,7 @@ class ApiClient {
   clearTokens() {
     this.token = null;
     this.refreshToken = null;
+    this.tokenExpiresAt = 0;
     try {
       localStorage.removeItem('auth_token');
       localStorage.removeItem('refresh_token');
@@ -65,17 +85,29 @@ class ApiClient {
 
   private async request<T>(
     endpoint: string,
-    options: RequestOptions = {}
+    options: RequestOptions = {},
+    isRetry = false
   ): Promise<ApiResponse<T>> {
     const { skipAuth, ...fetchOptions } = options;
 
+    // Refresh up front rather than spending a round trip on a guaranteed 401
+    if (
+      !skipAuth &&
+      this.refreshToken &&
+      this.tokenExpiresAt &&
+      Date.now() >= this.tokenExpiresAt - TOKEN_REFRESH_SKEW_MS
+    ) {
+      await this.refreshAccessToken();
+    }
+
     const headers: HeadersInit = {
       'Content-Type': 'application/json',
       ...fetchOptions.headers,
     };
 
-    if (!skipAuth && this.token) {
-      (headers as Record<string, string>)['Authorization'] = `Bearer ${this.token}`;
+    const sentToken = skipAuth ? null : this.token;
+    if (sentToken) {
+      (headers as Record<string, string>)['Authorization'] = `Bearer ${sentToken}`;
     }
 
     try {
@@ -87,12 +119,15 @@ class ApiClient {
       const data = await response.json();
 
       if (!response.ok) {
-        // Handle 401 - try refresh token
-        if (response.status === 401 && this.refreshToken) {
-          const refreshed = await this.refreshAccessToken();
+        // Handle 401 - try refresh token (once). If another request already
+        // rotated the token while this one was in flight, just retry with it.
+        if (response.status === 401 && this.refreshToken && !isRetry) {
+          const refreshed =
+            (this.token !== null && this.token !== sentToken) ||
+            (await this.refreshAccessToken());
           if (refreshed) {
             // Retry original request
-            return this.request(endpoint, options);
+            return this.request(endpoint, options, true);
           }
         }
         return { success: false, error: data.error || { code: 'ERROR', message: 'Request failed' } };
@@ -108,7 +143,17 @@ class ApiClient {
     }
   }
 
-  private async refreshAccessToken(): Promise<boolean> {
+  /** Concurrent callers share one in-flight refresh instead of each rotating the token */
+  private refreshAccessToken(): Promise<boolean> {
+    if (!this.refreshInFlight) {
+      this.refreshInFlight = this.performTokenRefresh().finally(() => {
+        this.refreshInFlight = null;
+      });
+    }
+    return this.refreshInFlight;
+  }
+
+  private async performTokenRefresh(): Promise<boolean> {
     try {
       const response = await fetch(`${API_BASE}/auth/refresh`, {
         method: 'POST',
@@ -536,7 +581,8 @@ export interface ApiQuote {
   changePercent: number;
   volume: number;
   lastUpdated: string;
-  mock?: boolean;
+  /** True when the backend fell back to generated data; always present */
+  mock: boolean;
 }
 
 export interface ApiHistoricalDataPoint {
@@ -319,20 +319,19 @@ export class MockEquityProvider implements EquityDataProvider {
     // Generate mock historical data
     const prices: EquityHistoricalPrice[] = []
     const daysDiff = Math.floor((to.getTime() - from.getTime()) / (1000 * 60 * 60 * 24))
-    
+    const date = new Date(from)
+
     for (let i = 0; i <= daysDiff; i++) {
-      const date = new Date(from)
-      date.setDate(date.getDate() + i)
-      
       const basePrice = data.price * (0.95 + Math.random() * 0.1)
       prices.push({
-        date: date.toISOString().split('T')[0],
+        date: date.toISOString().slice(0, 10),
         open: basePrice,
         high: basePrice * 1.02,
         low: basePrice * 0.98,
         close: basePrice * (0.99 + Math.random() * 0.02),
         volume: data.volume * (0.8 + Math.random() * 0.4)
       })
+      date.setDate(date.getDate() + 1)
     }
 
     return prices
@@ -469,6 +468,20 @@ export class MockThemeProvider implements ThemeDataProvider {
 // EXAMPLE: REAL API IMPLEMENTATION
 // ============================================================================
 
+/** Coerce a JSON field to a number, treating missing/empty values as 0 */
+function toNumber(value: unknown): number {
+  return value ? Number(value) : 0
+}
+
+type NumericFundamentalField = Exclude<keyof EquityFundamentals, 'symbol' | 'companyName' | 'sector' | 'industry'>
+
+const FUNDAMENTAL_NUMERIC_FIELDS: readonly NumericFundamentalField[] = [
+  'revenue', 'revenueGrowth', 'ebitda', 'ebitdaMargin', 'netIncome', 'netMargin', 'eps',
+  'totalAssets', 'totalLiabilities', 'totalEquity', 'cash', 'debt',
+  'roe', 'roa', 'roic',
+  'pe', 'pb', 'ps', 'evToEbitda', 'fcfYield',
+]
+
 /**
  * Example implementation using the backend market proxy.
  *
@@ -490,10 +503,10 @@ export class RealEquityDataProvider implements EquityDataProvider {
 
     return {
       symbol: quote.symbol || symbol,
-      price: Number(quote.price || 0),
-      change: Number(quote.change || 0),
-      changePercent: Number(quote.changePercent || 0),
-      volume: Number(quote.volume || 0),
+      price: toNumber(quote.price),
+      change: toNumber(quote.change),
+      changePercent: toNumber(quote.changePercent),
+      volume: toNumber(quote.volume),
       marketCap: 0,
       pe: 0,
       lastUpdated: quote.lastUpdated || new Date().toISOString(),
@@ -509,32 +522,16 @@ export class RealEquityDataProvider implements EquityDataProvider {
       throw new Error(`Failed to fetch fundamentals for ${symbol}`)
     }
 
-    return {
+    const fundamentals = {
       symbol: data.symbol || symbol,
       companyName: data.companyName,
       sector: data.sector,
       industry: data.industry,
-      revenue: Number(data.revenue || 0),
-      revenueGrowth: Number(data.revenueGrowth || 0),
-      ebitda: Number(data.ebitda || 0),
-      ebitdaMargin: Number(data.ebitdaMargin || 0),
-      netIncome: Number(data.netIncome || 0),
-      netMargin: Number(data.netMargin || 0),
-      eps: Number(data.eps || 0),
-      totalAssets: Number(data.totalAssets || 0),
-      totalLiabilities: Number(data.totalLiabilities || 0),
-      totalEquity: Number(data.totalEquity || 0),
-      cash: Number(data.cash || 0),
-      debt: Number(data.debt || 0),
-      roe: Number(data.roe || 0),
-      roa: Number(data.roa || 0),
-      roic: Number(data.roic || 0),
-      pe: Number(data.pe || 0),
-      pb: Number(data.pb || 0),
-      ps: Number(data.ps || 0),
-      evToEbitda: Number(data.evToEbitda || 0),
-      fcfYield: Number(data.fcfYield || 0),
+    } as EquityFundamentals
+    for (const field of FUNDAMENTAL_NUMERIC_FIELDS) {
+      fundamentals[field] = toNumber(data[field])
     }
+    return fundamentals
   }
 
   async getHistoricalPrices(symbol: string, from: Date, to: Date): Promise<EquityHistoricalPrice[]> {
@@ -554,16 +551,24 @@ export class RealEquityDataProvider implements EquityDataProvider {
       throw new Error(`Failed to fetch historical prices for ${symbol}`)
     }
 
-    return series
-      .map((c: any) => ({
+    const prices: EquityHistoricalPrice[] = new Array(series.length)
+    let ordered = true
+
+    for (let i = 0; i < series.length; i++) {
+      const c = series[i]
+      prices[i] = {
         date: c.date,
-        open: Number(c.open || 0),
-        high: Number(c.high || 0),
-        low: Number(c.low || 0),
-        close: Number(c.close || 0),
-        volume: Number(c.volume || 0),
-      }))
-      .sort((a: any, b: any) => a.date.localeCompare(b.date))
+        open: toNumber(c.open),
+        high: toNumber(c.high),
+        low: toNumber(c.low),
+        close: toNumber(c.close),
+        volume: toNumber(c.volume),
+      }
+      if (i > 0 && c.date < prices[i - 1].date) ordered = false
+    }
+
+    // Candles normally arrive in date order; ISO dates compare correctly as plain strings
+    return ordered ? prices : prices.sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0))
   }
 }
 
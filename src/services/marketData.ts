@@ -16,6 +16,19 @@ type NewsItem = {
 const CACHE_DURATION = 60000; // 1 minute cache
 const cache = new Map<string, { data: any; timestamp: number }>();
 
+const MOCK_PRICES: Record<string, number> = {
+  'AAPL': 175.50,
+  'MSFT': 295.25,
+  'GOOGL': 142.30,
+  'AMZN': 151.80,
+  'TSLA': 242.50,
+  'VOO': 425.75,
+  'SPY': 458.20,
+  'BTC': 52000,
+  'ETH': 3200,
+  'TLT': 98.50,
+};
+
 // NOTE: Provider secrets must remain server-side.
 // We proxy market data through the backend API under /api/v2/market.
 
@@ -37,21 +50,8 @@ export async function fetchStockPrice(symbol: string): Promise<number | null> {
     }
 
     // Fallback to mock data if FactSet API is not configured or fails
-    const mockPrices: Record<string, number> = {
-      'AAPL': 175.50,
-      'MSFT': 295.25,
-      'GOOGL': 142.30,
-      'AMZN': 151.80,
-      'TSLA': 242.50,
-      'VOO': 425.75,
-      'SPY': 458.20,
-      'BTC': 52000,
-      'ETH': 3200,
-      'TLT': 98.50,
-    };
-
     // Simulate realistic price fluctuations
-    const basePrice = mockPrices[symbol] || 100;
+    const basePrice = MOCK_PRICES[symbol] || 100;
     const fluctuation = (Math.random() - 0.5) * 2; // +/- 1%
     const mockPrice = basePrice * (1 + fluctuation / 100);
 
@@ -152,15 +152,22 @@ export async function fetchHistoricalData(symbol: string, days: number = 30) {
 
     const candles = response.success ? response.data?.data : undefined;
     if (Array.isArray(candles) && candles.length > 0) {
-      const mapped: PerformanceData[] = candles.map((c: any, index: number) => {
-        const value = typeof c?.close === 'number' ? c.close : 0;
-        const prev = index > 0 && typeof candles[index - 1]?.close === 'number' ? candles[index - 1].close : value;
-        return {
-          date: c?.date || new Date().toISOString().split('T')[0],
+      const today = new Date().toISOString().split('T')[0];
+      const mapped: PerformanceData[] = new Array(candles.length);
+      // Carry the previous close forward instead of re-reading candles[index - 1]
+      let prevClose: number | undefined;
+
+      for (let i = 0; i < candles.length; i++) {
+        const c = candles[i];
+        const close = c?.close;
+        const value = typeof close === 'number' ? close : 0;
+        mapped[i] = {
+          date: c?.date || today,
           value,
-          change: value - prev,
+          change: value - (prevClose ?? value),
         };
-      });
+        prevClose = typeof close === 'number' ? close : undefined;
+      }
 
       cache.set(cacheKey, { data: mapped, timestamp: Date.now() });
       return mapped;
@@ -259,35 +266,96 @@ export async function fetchNews(symbols: string[] = []) {
   }
 }
 
+const TRADING_DAYS = 252;
+const SQRT_TRADING_DAYS = Math.sqrt(TRADING_DAYS);
+
+// Numeric kernels over typed arrays: tight loops with no per-element
+// allocation or callbacks, shared by the risk metrics below.
+
+/** Mean and population variance of a series */
+function meanVariance(values: Float64Array): { mean: number; variance: number } {
+  let sum = 0;
+  for (let i = 0; i < values.length; i++) sum += values[i];
+  const mean = sum / values.length;
+
+  let squaredDeviationSum = 0;
+  for (let i = 0; i < values.length; i++) {
+    const deviation = values[i] - mean;
+    squaredDeviationSum += deviation * deviation;
+  }
+  return { mean, variance: squaredDeviationSum / values.length };
+}
+
+/** Largest peak-to-trough decline of a value series, in percent */
+function maxDrawdownPercent(values: Float64Array): number {
+  let maxDrawdown = 0;
+  let peak = values[0] || 0;
+  for (let i = 0; i < values.length; i++) {
+    if (values[i] > peak) peak = values[i];
+    const drawdown = ((peak - values[i]) / peak) * 100;
+    if (drawdown > maxDrawdown) maxDrawdown = drawdown;
+  }
+  return maxDrawdown;
+}
+
+/**
+ * k-th smallest value (0-based), partially reordering `values` in place.
+ * Quickselect: O(n) on average, versus sorting everything for one quantile.
+ */
+function selectKth(values: Float64Array, k: number): number {
+  let lo = 0;
+  let hi = values.length - 1;
+  while (lo < hi) {
+    const pivot = values[(lo + hi) >>> 1];
+    let i = lo;
+    let j = hi;
+    while (i <= j) {
+      while (values[i] < pivot) i++;
+      while (values[j] > pivot) j--;
+      if (i <= j) {
+        const tmp = values[i];
+        values[i] = values[j];
+        values[j] = tmp;
+        i++;
+        j--;
+      }
+    }
+    if (k <= j) hi = j;
+    else if (k >= i) lo = i;
+    else break;
+  }
+  return values[k];
+}
+
 export function calculateRiskMetrics(_investments: any[], historicalData: any[]) {
+  // Pull the value and daily-return series out of the points in one pass
+  const n = historicalData.length;
+  const levels = new Float64Array(n);
+  const returns = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    levels[i] = historicalData[i].value;
+    returns[i] = historicalData[i].change / levels[i];
+  }
+
   // Calculate portfolio volatility (standard deviation of returns)
-  const returns = historicalData.map(d => d.change / d.value);
-  const avgReturn = returns.reduce((sum, r) => sum + r, 0) / returns.length;
-  const variance = returns.reduce((sum, r) => sum + Math.pow(r - avgReturn, 2), 0) / returns.length;
-  const volatility = Math.sqrt(variance) * Math.sqrt(252) * 100; // Annualized
+  const { mean: avgReturn, variance } = meanVariance(returns);
+  const volatility = Math.sqrt(variance) * SQRT_TRADING_DAYS * 100; // Annualized
 
   // Calculate Sharpe Ratio (assuming 4% risk-free rate)
   const riskFreeRate = 0.04;
-  const excessReturn = avgReturn * 252 - riskFreeRate;
-  const sharpeRatio = excessReturn / (Math.sqrt(variance) * Math.sqrt(252));
+  const excessReturn = avgReturn * TRADING_DAYS - riskFreeRate;
+  const sharpeRatio = excessReturn / (Math.sqrt(variance) * SQRT_TRADING_DAYS);
 
   // Mock beta (correlation with market)
   const beta = 0.8 + Math.random() * 0.6; // Between 0.8 and 1.4
 
   // Calculate max drawdown
-  let maxDrawdown = 0;
-  let peak = historicalData[0]?.value || 0;
-  
-  for (const point of historicalData) {
-    if (point.value > peak) peak = point.value;
-    const drawdown = ((peak - point.value) / peak) * 100;
-    if (drawdown > maxDrawdown) maxDrawdown = drawdown;
-  }
+  const maxDrawdown = maxDrawdownPercent(levels);
 
   // Value at Risk (95% confidence, 1-day)
-  const sortedReturns = [...returns].sort((a, b) => a - b);
   const varIndex = Math.floor(returns.length * 0.05);
-  const valueAtRisk = Math.abs(sortedReturns[varIndex] || 0) * 100;
+  const varReturn = returns.length > 0 ? selectKth(returns.slice(), varIndex) : 0;
+  const valueAtRisk = Math.abs(varReturn || 0) * 100;
 
   // Determine risk level
   let riskLevel: 'conservative' | 'moderate' | 'aggressive';